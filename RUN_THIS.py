@@ -12,11 +12,12 @@ This script demonstrates the interaction between two MCP servers (AI agents).
 """
 
 import asyncio
-import json
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, Any
 
+import orjson
+
 # Import our MCP servers
 import sys
 import os
@@ -32,6 +33,22 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Section separators for the workflow log output
+_SEP80 = "=" * 80
+_SEP50 = "=" * 50
+
+
+class _LazyJSON:
+    """Defer JSON rendering of a log argument until a handler emits it."""
+    
+    __slots__ = ("obj",)
+    
+    def __init__(self, obj: Any):
+        self.obj = obj
+    
+    def __str__(self) -> str:
+        return orjson.dumps(self.obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+
 
 class ECommerceWorkflow:
     """Demonstrates the interaction between Order Management and Payment Processing MCP servers."""
@@ -50,9 +67,9 @@ class ECommerceWorkflow:
     
     async def run_complete_workflow(self):
         """Run a complete e-commerce workflow demonstration."""
-        logger.info("=" * 80)
+        logger.info(_SEP80)
         logger.info("STARTING E-COMMERCE WORKFLOW DEMONSTRATION")
-        logger.info("=" * 80)
+        logger.info(_SEP80)
         
         # Step 1: Display server information
         await self._display_server_info()
@@ -64,7 +81,7 @@ class ECommerceWorkflow:
             return
         
         order_id = order_result["order_id"]
-        logger.info(f"Order placed successfully: {order_id}")
+        logger.info("Order placed successfully: %s", order_id)
         
         # Step 3: Process payment for the order
         payment_result = await self._process_payment(order_id)
@@ -74,7 +91,7 @@ class ECommerceWorkflow:
             return
         
         payment_id = payment_result["payment_id"]
-        logger.info(f"Payment processed successfully: {payment_id}")
+        logger.info("Payment processed successfully: %s", payment_id)
         
         # Step 4: Update order status
         await self._update_order_status(order_id, "confirmed")
@@ -85,59 +102,63 @@ class ECommerceWorkflow:
         # Step 6: Generate reports
         await self._generate_reports()
         
-        logger.info("=" * 80)
+        logger.info(_SEP80)
         logger.info("E-COMMERCE WORKFLOW DEMONSTRATION COMPLETED")
-        logger.info("=" * 80)
+        logger.info(_SEP80)
     
     async def _display_server_info(self):
         """Display information about both MCP servers."""
-        logger.info("\n" + "=" * 50)
+        logger.info("\n%s", _SEP50)
         logger.info("SERVER INFORMATION")
-        logger.info("=" * 50)
+        logger.info(_SEP50)
+        
+        # The four lookups are independent, so issue them together
+        order_info, payment_info, order_tools, payment_tools = await asyncio.gather(
+            self.order_server.get_server_info(),
+            self.payment_server.get_server_info(),
+            self.order_server.get_available_tools(),
+            self.payment_server.get_available_tools()
+        )
         
         # Order Management Server Info
-        order_info = await self.order_server.get_server_info()
-        logger.info(f"Order Management Server:")
-        logger.info(f"  - Name: {order_info['name']}")
-        logger.info(f"  - Version: {order_info['version']}")
-        logger.info(f"  - Tools: {order_info['tools_count']}")
-        logger.info(f"  - Orders: {order_info['orders_count']}")
-        logger.info(f"  - Customers: {order_info['customers_count']}")
-        logger.info(f"  - Products: {order_info['products_count']}")
+        logger.info("Order Management Server:")
+        logger.info("  - Name: %s", order_info['name'])
+        logger.info("  - Version: %s", order_info['version'])
+        logger.info("  - Tools: %s", order_info['tools_count'])
+        logger.info("  - Orders: %s", order_info['orders_count'])
+        logger.info("  - Customers: %s", order_info['customers_count'])
+        logger.info("  - Products: %s", order_info['products_count'])
         
         # Payment Processing Server Info
-        payment_info = await self.payment_server.get_server_info()
-        logger.info(f"\nPayment Processing Server:")
-        logger.info(f"  - Name: {payment_info['name']}")
-        logger.info(f"  - Version: {payment_info['version']}")
-        logger.info(f"  - Tools: {payment_info['tools_count']}")
-        logger.info(f"  - Payments: {payment_info['payments_count']}")
-        logger.info(f"  - Customers: {payment_info['customers_count']}")
-        logger.info(f"  - Transactions: {payment_info['transactions_count']}")
+        logger.info("\nPayment Processing Server:")
+        logger.info("  - Name: %s", payment_info['name'])
+        logger.info("  - Version: %s", payment_info['version'])
+        logger.info("  - Tools: %s", payment_info['tools_count'])
+        logger.info("  - Payments: %s", payment_info['payments_count'])
+        logger.info("  - Customers: %s", payment_info['customers_count'])
+        logger.info("  - Transactions: %s", payment_info['transactions_count'])
         
         # Display available tools
-        logger.info(f"\nOrder Management Tools:")
-        order_tools = await self.order_server.get_available_tools()
+        logger.info("\nOrder Management Tools:")
         for tool in order_tools:
-            logger.info(f"  - {tool['name']}: {tool['description']}")
+            logger.info("  - %s: %s", tool['name'], tool['description'])
         
-        logger.info(f"\nPayment Processing Tools:")
-        payment_tools = await self.payment_server.get_available_tools()
+        logger.info("\nPayment Processing Tools:")
         for tool in payment_tools:
-            logger.info(f"  - {tool['name']}: {tool['description']}")
+            logger.info("  - %s: %s", tool['name'], tool['description'])
     
     async def _place_order(self) -> Dict[str, Any]:
         """Place a new order using the Order Management MCP Server."""
-        logger.info("\n" + "=" * 50)
+        logger.info("\n%s", _SEP50)
         logger.info("STEP 1: PLACING ORDER")
-        logger.info("=" * 50)
+        logger.info(_SEP50)
         
         # First, check inventory for products
         logger.info("Checking inventory...")
         inventory_check = await self.order_server.call_tool("check_inventory", {
             "product_id": "prod_001"
         })
-        logger.info(f"Inventory check result: {inventory_check}")
+        logger.info("Inventory check result: %s", inventory_check)
         
         # Place the order
         order_data = {
@@ -156,29 +177,29 @@ class ECommerceWorkflow:
             }
         }
         
-        logger.info(f"Placing order with data: {json.dumps(order_data, indent=2)}")
+        logger.info("Placing order with data: %s", _LazyJSON(order_data))
         
         result = await self.order_server.call_tool("create_order", order_data)
-        logger.info(f"Order creation result: {json.dumps(result, indent=2)}")
+        logger.info("Order creation result: %s", _LazyJSON(result))
         
         return result
     
     async def _process_payment(self, order_id: str) -> Dict[str, Any]:
         """Process payment for an order using the Payment Processing MCP Server."""
-        logger.info("\n" + "=" * 50)
+        logger.info("\n%s", _SEP50)
         logger.info("STEP 2: PROCESSING PAYMENT")
-        logger.info("=" * 50)
+        logger.info(_SEP50)
         
         # Get order details to know the amount
         order_details = await self.order_server.call_tool("get_order", {"order_id": order_id})
         if not order_details.get("success"):
-            logger.error(f"Failed to get order details: {order_details}")
+            logger.error("Failed to get order details: %s", order_details)
             return {"success": False, "error": "Failed to get order details"}
         
         order = order_details["order"]
         total_amount = order["total_amount"]
         
-        logger.info(f"Processing payment for order {order_id} - Amount: ${total_amount}")
+        logger.info("Processing payment for order %s - Amount: $%s", order_id, total_amount)
         
         # Process payment
         payment_data = {
@@ -196,18 +217,18 @@ class ECommerceWorkflow:
             "customer_id": order["customer_id"]
         }
         
-        logger.info(f"Payment data: {json.dumps(payment_data, indent=2)}")
+        logger.info("Payment data: %s", _LazyJSON(payment_data))
         
         result = await self.payment_server.call_tool("process_payment", payment_data)
-        logger.info(f"Payment processing result: {json.dumps(result, indent=2)}")
+        logger.info("Payment processing result: %s", _LazyJSON(result))
         
         return result
     
     async def _handle_payment_failure(self, order_id: str):
         """Handle payment failure scenario."""
-        logger.info("\n" + "=" * 50)
+        logger.info("\n%s", _SEP50)
         logger.info("HANDLING PAYMENT FAILURE")
-        logger.info("=" * 50)
+        logger.info(_SEP50)
         
         # Update order status to reflect payment failure
         await self.order_server.call_tool("update_order_status", {
@@ -215,7 +236,7 @@ class ECommerceWorkflow:
             "status": "cancelled"
         })
         
-        logger.info(f"Order {order_id} cancelled due to payment failure")
+        logger.info("Order %s cancelled due to payment failure", order_id)
         
         # Demonstrate alternative payment methods
         logger.info("Attempting payment with alternative method...")
@@ -236,44 +257,44 @@ class ECommerceWorkflow:
             "customer_id": "cust_001"
         })
         
-        logger.info(f"Alternative payment result: {json.dumps(alternative_payment, indent=2)}")
+        logger.info("Alternative payment result: %s", _LazyJSON(alternative_payment))
     
     async def _update_order_status(self, order_id: str, status: str):
         """Update order status."""
-        logger.info("\n" + "=" * 50)
+        logger.info("\n%s", _SEP50)
         logger.info("STEP 3: UPDATING ORDER STATUS")
-        logger.info("=" * 50)
+        logger.info(_SEP50)
         
         result = await self.order_server.call_tool("update_order_status", {
             "order_id": order_id,
             "status": status
         })
         
-        logger.info(f"Order status update result: {json.dumps(result, indent=2)}")
+        logger.info("Order status update result: %s", _LazyJSON(result))
         
         # Get updated order details
         order_details = await self.order_server.call_tool("get_order", {"order_id": order_id})
-        logger.info(f"Updated order details: {json.dumps(order_details, indent=2)}")
+        logger.info("Updated order details: %s", _LazyJSON(order_details))
     
     async def _demonstrate_additional_operations(self, order_id: str, payment_id: str):
         """Demonstrate additional operations like refunds, order tracking, etc."""
-        logger.info("\n" + "=" * 50)
+        logger.info("\n%s", _SEP50)
         logger.info("STEP 4: ADDITIONAL OPERATIONS")
-        logger.info("=" * 50)
+        logger.info(_SEP50)
         
         # 1. Get customer order history
         logger.info("\n--- Customer Order History ---")
         customer_orders = await self.order_server.call_tool("get_customer_orders", {
             "customer_id": "cust_001"
         })
-        logger.info(f"Customer orders: {json.dumps(customer_orders, indent=2)}")
+        logger.info("Customer orders: %s", _LazyJSON(customer_orders))
         
         # 2. Get payment details
         logger.info("\n--- Payment Details ---")
         payment_details = await self.payment_server.call_tool("get_payment", {
             "payment_id": payment_id
         })
-        logger.info(f"Payment details: {json.dumps(payment_details, indent=2)}")
+        logger.info("Payment details: %s", _LazyJSON(payment_details))
         
         # 3. Demonstrate partial refund
         logger.info("\n--- Processing Partial Refund ---")
@@ -282,7 +303,7 @@ class ECommerceWorkflow:
             "amount": 29.99,  # Refund the mouse
             "reason": "Customer requested refund for wireless mouse"
         })
-        logger.info(f"Refund result: {json.dumps(refund_result, indent=2)}")
+        logger.info("Refund result: %s", _LazyJSON(refund_result))
         
         # 4. Add a new customer
         logger.info("\n--- Adding New Customer ---")
@@ -298,7 +319,7 @@ class ECommerceWorkflow:
                 "country": "USA"
             }
         })
-        logger.info(f"New customer result: {json.dumps(new_customer, indent=2)}")
+        logger.info("New customer result: %s", _LazyJSON(new_customer))
         
         # 5. Add payment method for customer
         logger.info("\n--- Adding Payment Method ---")
@@ -313,7 +334,7 @@ class ECommerceWorkflow:
                 "is_default": False
             }
         })
-        logger.info(f"Payment method result: {json.dumps(payment_method, indent=2)}")
+        logger.info("Payment method result: %s", _LazyJSON(payment_method))
         
         # 6. Validate payment method
         logger.info("\n--- Validating Payment Method ---")
@@ -327,44 +348,45 @@ class ECommerceWorkflow:
                 "card_type": "Visa"
             }
         })
-        logger.info(f"Validation result: {json.dumps(validation, indent=2)}")
+        logger.info("Validation result: %s", _LazyJSON(validation))
     
     async def _generate_reports(self):
         """Generate various reports from both servers."""
-        logger.info("\n" + "=" * 50)
+        logger.info("\n%s", _SEP50)
         logger.info("STEP 5: GENERATING REPORTS")
-        logger.info("=" * 50)
+        logger.info(_SEP50)
         
         # Payment statistics
         logger.info("\n--- Payment Statistics ---")
+        now = datetime.now()
         payment_stats = await self.payment_server.call_tool("get_payment_statistics", {
-            "start_date": (datetime.now() - timedelta(days=30)).isoformat(),
-            "end_date": datetime.now().isoformat(),
+            "start_date": (now - timedelta(days=30)).isoformat(),
+            "end_date": now.isoformat(),
             "currency": "USD"
         })
-        logger.info(f"Payment statistics: {json.dumps(payment_stats, indent=2)}")
+        logger.info("Payment statistics: %s", _LazyJSON(payment_stats))
         
         # Customer payments
         logger.info("\n--- Customer Payment History ---")
         customer_payments = await self.payment_server.call_tool("get_customer_payments", {
             "customer_id": "cust_001"
         })
-        logger.info(f"Customer payments: {json.dumps(customer_payments, indent=2)}")
+        logger.info("Customer payments: %s", _LazyJSON(customer_payments))
         
         # Inventory status
         logger.info("\n--- Current Inventory Status ---")
-        for product_id in ["prod_001", "prod_002", "prod_003"]:
-            inventory = await self.order_server.call_tool("check_inventory", {
-                "product_id": product_id
-            })
-            logger.info(f"Inventory for {product_id}: {json.dumps(inventory, indent=2)}")
+        inventory = await self.order_server.call_tool("check_inventory_batch", {
+            "product_ids": ["prod_001", "prod_002", "prod_003"]
+        })
+        for product_id, product in inventory.get("products", {}).items():
+            logger.info("Inventory for %s: %s", product_id, _LazyJSON(product))
 
 
 async def demonstrate_error_scenarios():
     """Demonstrate error handling scenarios."""
-    logger.info("\n" + "=" * 80)
+    logger.info("\n%s", _SEP80)
     logger.info("ERROR SCENARIOS DEMONSTRATION")
-    logger.info("=" * 80)
+    logger.info(_SEP80)
     
     workflow = ECommerceWorkflow()
     
@@ -375,7 +397,7 @@ async def demonstrate_error_scenarios():
         "items": [{"product_id": "prod_001", "quantity": 1}],
         "shipping_address": {"street": "123 Test St", "city": "Test City"}
     })
-    logger.info(f"Error result: {json.dumps(result, indent=2)}")
+    logger.info("Error result: %s", _LazyJSON(result))
     
     # 2. Try to create order with insufficient inventory
     logger.info("\n--- Error: Insufficient Inventory ---")
@@ -384,7 +406,7 @@ async def demonstrate_error_scenarios():
         "items": [{"product_id": "prod_001", "quantity": 1000}],  # More than available
         "shipping_address": {"street": "123 Test St", "city": "Test City"}
     })
-    logger.info(f"Error result: {json.dumps(result, indent=2)}")
+    logger.info("Error result: %s", _LazyJSON(result))
     
     # 3. Try to process payment with invalid currency
     logger.info("\n--- Error: Invalid Currency ---")
@@ -396,7 +418,7 @@ async def demonstrate_error_scenarios():
         "order_id": "test_order",
         "customer_id": "cust_001"
     })
-    logger.info(f"Error result: {json.dumps(result, indent=2)}")
+    logger.info("Error result: %s", _LazyJSON(result))
     
     # 4. Try to refund non-existent payment
     logger.info("\n--- Error: Non-existent Payment ---")
@@ -404,7 +426,7 @@ async def demonstrate_error_scenarios():
         "payment_id": "non_existent_payment",
         "reason": "Test refund"
     })
-    logger.info(f"Error result: {json.dumps(result, indent=2)}")
+    logger.info("Error result: %s", _LazyJSON(result))
 
 
 async def main():
@@ -417,15 +439,22 @@ async def main():
         # Run error scenarios
         await demonstrate_error_scenarios()
         
-        logger.info("\n" + "=" * 80)
+        logger.info("\n%s", _SEP80)
         logger.info("ALL DEMONSTRATIONS COMPLETED SUCCESSFULLY")
-        logger.info("=" * 80)
+        logger.info(_SEP80)
         
     except Exception as e:
-        logger.error(f"Error during demonstration: {str(e)}")
+        logger.error("Error during demonstration: %s", e)
         import traceback
         traceback.print_exc()
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    # Use the libuv-based event loop when it is available, without
+    # installing a global event loop policy
+    try:
+        from uvloop import run
+    except ImportError:
+        from asyncio import run
+    
+    run(main()) 
\ No newline at end of file
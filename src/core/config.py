@@ -5,12 +5,37 @@ This module handles configuration loading, validation, and management
 for the Apache Synapse MCP server.
 """
 
+import copy
 import os
+import time
 import yaml
 from typing import Dict, Any, Optional
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field, fields
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    from yaml import CSafeDumper as _SafeDumper, CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper, SafeLoader as _SafeLoader
+
+
+# Seconds a path existence check made by validate() is reused
+_PATH_CHECK_TTL = 60
+
+
+@lru_cache(maxsize=16)
+def _path_exists(path: str, time_bucket: int) -> bool:
+    """Check whether a path exists, cached per path and time bucket."""
+    return os.path.exists(path)
+
+
+@lru_cache(maxsize=16)
+def _load_yaml(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a YAML file, cached by path, modification time and size."""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_SafeLoader)
+
 
 @dataclass
 class SecurityConfig:
@@ -23,6 +48,7 @@ class SecurityConfig:
     api_key_header: str = "X-API-Key"
     rate_limit_requests: int = 100
     rate_limit_window: int = 60  # seconds
+    auth_cache_ttl: int = 300  # seconds, 0 disables caching
 
 
 @dataclass
@@ -55,6 +81,17 @@ class CacheConfig:
     max_size: int = 1000
 
 
+# Config file sections stored as flat SynapseMCPConfig fields: section -> (field prefix, keys)
+_FLAT_SECTIONS = {
+    "server": ("", ("host", "port", "debug")),
+    "synapse": ("synapse_", ("home", "config_dir", "repository_dir")),
+    "mcp": ("mcp_", ("server_name", "server_version", "tools_enabled", "resources_enabled"))
+}
+
+# Config file sections stored as nested dataclasses of the same name
+_NESTED_SECTIONS = ("security", "monitoring", "database", "cache")
+
+
 @dataclass
 class SynapseMCPConfig:
     """Main configuration class for Synapse MCP Server."""
@@ -92,11 +129,15 @@ class SynapseMCPConfig:
         """Load configuration from YAML file."""
         config_path = Path(config_path)
         
-        if not config_path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {config_path}")
+        try:
+            stat = config_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
         
-        with open(config_path, 'r') as f:
-            config_data = yaml.safe_load(f)
+        # Copy the cached parse so callers never share or mutate it
+        config_data = copy.deepcopy(
+            _load_yaml(str(config_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        )
         
         return cls.from_dict(config_data)
     
@@ -105,120 +146,37 @@ class SynapseMCPConfig:
         """Create configuration from dictionary."""
         config = cls()
         
-        # Update server settings
-        if "server" in config_data:
-            server_config = config_data["server"]
-            config.host = server_config.get("host", config.host)
-            config.port = server_config.get("port", config.port)
-            config.debug = server_config.get("debug", config.debug)
-        
-        # Update security settings
-        if "security" in config_data:
-            security_data = config_data["security"]
-            config.security.enabled = security_data.get("enabled", config.security.enabled)
-            config.security.auth_type = security_data.get("auth_type", config.security.auth_type)
-            config.security.jwt_secret = security_data.get("jwt_secret", config.security.jwt_secret)
-            config.security.oauth2_client_id = security_data.get("oauth2_client_id", config.security.oauth2_client_id)
-            config.security.oauth2_client_secret = security_data.get("oauth2_client_secret", config.security.oauth2_client_secret)
-            config.security.api_key_header = security_data.get("api_key_header", config.security.api_key_header)
-            config.security.rate_limit_requests = security_data.get("rate_limit_requests", config.security.rate_limit_requests)
-            config.security.rate_limit_window = security_data.get("rate_limit_window", config.security.rate_limit_window)
-        
-        # Update monitoring settings
-        if "monitoring" in config_data:
-            monitoring_data = config_data["monitoring"]
-            config.monitoring.enabled = monitoring_data.get("enabled", config.monitoring.enabled)
-            config.monitoring.metrics_port = monitoring_data.get("metrics_port", config.monitoring.metrics_port)
-            config.monitoring.log_level = monitoring_data.get("log_level", config.monitoring.log_level)
-            config.monitoring.log_format = monitoring_data.get("log_format", config.monitoring.log_format)
-            config.monitoring.prometheus_enabled = monitoring_data.get("prometheus_enabled", config.monitoring.prometheus_enabled)
-            config.monitoring.health_check_interval = monitoring_data.get("health_check_interval", config.monitoring.health_check_interval)
-        
-        # Update database settings
-        if "database" in config_data:
-            database_data = config_data["database"]
-            config.database.type = database_data.get("type", config.database.type)
-            config.database.url = database_data.get("url", config.database.url)
-            config.database.pool_size = database_data.get("pool_size", config.database.pool_size)
-            config.database.max_overflow = database_data.get("max_overflow", config.database.max_overflow)
-            config.database.echo = database_data.get("echo", config.database.echo)
-        
-        # Update cache settings
-        if "cache" in config_data:
-            cache_data = config_data["cache"]
-            config.cache.type = cache_data.get("type", config.cache.type)
-            config.cache.redis_url = cache_data.get("redis_url", config.cache.redis_url)
-            config.cache.ttl = cache_data.get("ttl", config.cache.ttl)
-            config.cache.max_size = cache_data.get("max_size", config.cache.max_size)
-        
-        # Update Synapse settings
-        if "synapse" in config_data:
-            synapse_data = config_data["synapse"]
-            config.synapse_home = synapse_data.get("home", config.synapse_home)
-            config.synapse_config_dir = synapse_data.get("config_dir", config.synapse_config_dir)
-            config.synapse_repository_dir = synapse_data.get("repository_dir", config.synapse_repository_dir)
-        
-        # Update MCP settings
-        if "mcp" in config_data:
-            mcp_data = config_data["mcp"]
-            config.mcp_server_name = mcp_data.get("server_name", config.mcp_server_name)
-            config.mcp_server_version = mcp_data.get("server_version", config.mcp_server_version)
-            config.mcp_tools_enabled = mcp_data.get("tools_enabled", config.mcp_tools_enabled)
-            config.mcp_resources_enabled = mcp_data.get("resources_enabled", config.mcp_resources_enabled)
+        # Update server, Synapse and MCP settings
+        for section, (prefix, keys) in _FLAT_SECTIONS.items():
+            section_data = config_data.get(section)
+            if section_data:
+                for key in keys:
+                    if key in section_data:
+                        setattr(config, prefix + key, section_data[key])
+        
+        # Update security, monitoring, database and cache settings
+        for section in _NESTED_SECTIONS:
+            section_data = config_data.get(section)
+            if section_data:
+                nested = getattr(config, section)
+                for f in fields(nested):
+                    if f.name in section_data:
+                        setattr(nested, f.name, section_data[f.name])
         
         return config
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary."""
-        return {
-            "server": {
-                "host": self.host,
-                "port": self.port,
-                "debug": self.debug
-            },
-            "security": {
-                "enabled": self.security.enabled,
-                "auth_type": self.security.auth_type,
-                "jwt_secret": self.security.jwt_secret,
-                "oauth2_client_id": self.security.oauth2_client_id,
-                "oauth2_client_secret": self.security.oauth2_client_secret,
-                "api_key_header": self.security.api_key_header,
-                "rate_limit_requests": self.security.rate_limit_requests,
-                "rate_limit_window": self.security.rate_limit_window
-            },
-            "monitoring": {
-                "enabled": self.monitoring.enabled,
-                "metrics_port": self.monitoring.metrics_port,
-                "log_level": self.monitoring.log_level,
-                "log_format": self.monitoring.log_format,
-                "prometheus_enabled": self.monitoring.prometheus_enabled,
-                "health_check_interval": self.monitoring.health_check_interval
-            },
-            "database": {
-                "type": self.database.type,
-                "url": self.database.url,
-                "pool_size": self.database.pool_size,
-                "max_overflow": self.database.max_overflow,
-                "echo": self.database.echo
-            },
-            "cache": {
-                "type": self.cache.type,
-                "redis_url": self.cache.redis_url,
-                "ttl": self.cache.ttl,
-                "max_size": self.cache.max_size
-            },
-            "synapse": {
-                "home": self.synapse_home,
-                "config_dir": self.synapse_config_dir,
-                "repository_dir": self.synapse_repository_dir
-            },
-            "mcp": {
-                "server_name": self.mcp_server_name,
-                "server_version": self.mcp_server_version,
-                "tools_enabled": self.mcp_tools_enabled,
-                "resources_enabled": self.mcp_resources_enabled
-            }
+        data = asdict(self)
+        flat = {
+            section: {key: data[prefix + key] for key in keys}
+            for section, (prefix, keys) in _FLAT_SECTIONS.items()
         }
+        
+        result = {"server": flat.pop("server")}
+        result.update((section, data[section]) for section in _NESTED_SECTIONS)
+        result.update(flat)
+        return result
     
     def save_to_file(self, config_path: str):
         """Save configuration to YAML file."""
@@ -226,7 +184,7 @@ class SynapseMCPConfig:
         config_path.parent.mkdir(parents=True, exist_ok=True)
         
         with open(config_path, 'w') as f:
-            yaml.dump(self.to_dict(), f, default_flow_style=False, indent=2)
+            yaml.dump(self.to_dict(), f, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False, indent=2)
     
     def validate(self) -> bool:
         """Validate configuration settings."""
@@ -251,7 +209,7 @@ class SynapseMCPConfig:
             errors.append("Invalid cache type")
         
         # Validate Synapse paths
-        if not os.path.exists(self.synapse_home):
+        if not _path_exists(self.synapse_home, int(time.monotonic() // _PATH_CHECK_TTL)):
             errors.append(f"Synapse home directory does not exist: {self.synapse_home}")
         
         if errors:
@@ -278,9 +236,10 @@ def load_config(config_path: Optional[str] = None) -> SynapseMCPConfig:
     ]
     
     for path in default_paths:
-        expanded_path = os.path.expanduser(path)
-        if os.path.exists(expanded_path):
-            return SynapseMCPConfig.from_file(expanded_path)
+        try:
+            return SynapseMCPConfig.from_file(os.path.expanduser(path))
+        except FileNotFoundError:
+            continue
     
     # Return default configuration
     return SynapseMCPConfig() 
\ No newline at end of file
@@ -6,8 +6,11 @@ and provides access to Apache Synapse capabilities.
 """
 
 import asyncio
+import concurrent.futures
+import json
 import logging
-from typing import Dict, List, Optional, Any
+import re
+from typing import Dict, List, Optional, Any, Awaitable, Callable, Coroutine
 from dataclasses import dataclass
 
 from mcp import ServerSession, StdioServerParameters
@@ -27,7 +30,7 @@ from mcp.types import (
     ReadResourceResult,
 )
 
-from ..config import SynapseMCPConfig
+from .config import SynapseMCPConfig
 from ..services.proxy_service import ProxyService
 from ..transformers.message_transformer import MessageTransformer
 from ..security.auth_manager import AuthManager
@@ -36,6 +39,102 @@ from ..monitoring.metrics import MetricsCollector
 logger = logging.getLogger(__name__)
 
 
+# Maximum number of operations accepted by a single batch_execute call
+BATCH_MAX_OPERATIONS = 100
+
+# Tool definitions are static, so build them once at import time
+_TOOLS = [
+    Tool(
+        name="create_proxy_service",
+        description="Create a new proxy service in Synapse",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "description": "Service name"},
+                "target": {"type": "string", "description": "Target URL"},
+                "transforms": {"type": "array", "items": {"type": "string"}},
+                "security": {"type": "string", "description": "Security type"}
+            },
+            "required": ["name", "target"]
+        }
+    ),
+    Tool(
+        name="list_services",
+        description="List all available Synapse services",
+        inputSchema={"type": "object", "properties": {}}
+    ),
+    Tool(
+        name="transform_message",
+        description="Transform a message using specified transformer",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "transformer": {"type": "string", "description": "Transformer name"},
+                "message": {"type": "string", "description": "Message to transform"},
+                "format": {"type": "string", "description": "Input format"}
+            },
+            "required": ["transformer", "message"]
+        }
+    ),
+    Tool(
+        name="route_message",
+        description="Route a message based on rules",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "message": {"type": "string", "description": "Message to route"},
+                "rules": {"type": "object", "description": "Routing rules"}
+            },
+            "required": ["message", "rules"]
+        }
+    ),
+    Tool(
+        name="get_service_metrics",
+        description="Get performance metrics for a service",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "service_name": {"type": "string", "description": "Service name"}
+            },
+            "required": ["service_name"]
+        }
+    ),
+    Tool(
+        name="batch_execute",
+        description="Execute several tool calls concurrently in one request",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "operations": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "tool": {"type": "string", "description": "Tool name"},
+                            "arguments": {"type": "object", "description": "Tool arguments"}
+                        },
+                        "required": ["tool"]
+                    },
+                    "minItems": 1,
+                    "maxItems": BATCH_MAX_OPERATIONS
+                },
+                "maxConcurrent": {"type": "integer", "minimum": 1, "description": "Maximum operations in flight"},
+                "stopOnError": {"type": "boolean", "description": "Cancel remaining operations on the first failure"}
+            },
+            "required": ["operations"]
+        }
+    )
+]
+
+_LIST_TOOLS_RESULT = ListToolsResult(tools=_TOOLS)
+
+# Idempotent, read-only tools that may execute before authentication completes
+_SAFE_TOOLS = frozenset({"list_services", "get_service_metrics"})
+
+# Resource URIs served by _read_resource, e.g. synapse://services/<name>
+_URI_RE = re.compile(r"^synapse://services/(?P<name>[^/]+)$")
+
+
 @dataclass
 class SynapseService:
     """Represents a Synapse service configuration."""
@@ -57,8 +156,13 @@ class SynapseMCPServer:
         self.auth_manager = AuthManager(self.config.security)
         self.metrics = MetricsCollector()
         self.services: Dict[str, SynapseService] = {}
+        # Service name -> MCP Resource, kept in sync with self.services
+        self._resources_mirror: Dict[str, Resource] = {}
         self.transformers: Dict[str, MessageTransformer] = {}
         
+        # Loop serving MCP requests while start() is running, used by call_sync
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        
         # Initialize MCP server
         self.mcp_server = ServerSession(
             StdioServerParameters(
@@ -72,6 +176,16 @@ class SynapseMCPServer:
         
         # Initialize default services
         self._initialize_default_services()
+        
+        # Tool name -> handler coroutine, looked up once per call
+        self._dispatch: Dict[str, Callable[[Dict[str, Any]], Awaitable[str]]] = {
+            "create_proxy_service": self._create_proxy_service,
+            "list_services": lambda arguments: self._list_services(),
+            "transform_message": self._transform_message,
+            "route_message": self._route_message,
+            "get_service_metrics": self._get_service_metrics,
+            "batch_execute": self._batch_execute,
+        }
     
     def _register_handlers(self):
         """Register MCP protocol handlers."""
@@ -79,25 +193,38 @@ class SynapseMCPServer:
         @self.mcp_server.list_tools()
         async def handle_list_tools(request: ListToolsRequest) -> ListToolsResult:
             """Handle list tools request."""
-            try:
-                tools = await self._get_available_tools()
-                return ListToolsResult(tools=tools)
-            except Exception as e:
-                logger.error(f"Error listing tools: {e}")
-                return ListToolsResult(tools=[])
+            return _LIST_TOOLS_RESULT
         
         @self.mcp_server.call_tool()
         async def handle_call_tool(request: CallToolRequest) -> CallToolResult:
             """Handle tool call request."""
             try:
-                # Authenticate request
-                if not await self.auth_manager.authenticate_request(request):
-                    return CallToolResult(
-                        content=[TextContent(type="text", text="Authentication failed")]
+                if request.name in _SAFE_TOOLS:
+                    # Read-only tools run alongside authentication; the result is
+                    # discarded, errors included, if authentication fails
+                    authenticated, result = await asyncio.gather(
+                        self.auth_manager.authenticate_request(request),
+                        self._process_tool_call(request),
+                        return_exceptions=True
                     )
+                    if isinstance(authenticated, BaseException):
+                        raise authenticated
+                    if not authenticated:
+                        return CallToolResult(
+                            content=[TextContent(type="text", text="Authentication failed")]
+                        )
+                    if isinstance(result, BaseException):
+                        raise result
+                else:
+                    # Authenticate request
+                    if not await self.auth_manager.authenticate_request(request):
+                        return CallToolResult(
+                            content=[TextContent(type="text", text="Authentication failed")]
+                        )
+                    
+                    # Process tool call
+                    result = await self._process_tool_call(request)
                 
-                # Process tool call
-                result = await self._process_tool_call(request)
                 return CallToolResult(content=[TextContent(type="text", text=result)])
                 
             except Exception as e:
@@ -132,82 +259,14 @@ class SynapseMCPServer:
     
     async def _get_available_tools(self) -> List[Tool]:
         """Get list of available MCP tools."""
-        tools = [
-            Tool(
-                name="create_proxy_service",
-                description="Create a new proxy service in Synapse",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "name": {"type": "string", "description": "Service name"},
-                        "target": {"type": "string", "description": "Target URL"},
-                        "transforms": {"type": "array", "items": {"type": "string"}},
-                        "security": {"type": "string", "description": "Security type"}
-                    },
-                    "required": ["name", "target"]
-                }
-            ),
-            Tool(
-                name="list_services",
-                description="List all available Synapse services",
-                inputSchema={"type": "object", "properties": {}}
-            ),
-            Tool(
-                name="transform_message",
-                description="Transform a message using specified transformer",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "transformer": {"type": "string", "description": "Transformer name"},
-                        "message": {"type": "string", "description": "Message to transform"},
-                        "format": {"type": "string", "description": "Input format"}
-                    },
-                    "required": ["transformer", "message"]
-                }
-            ),
-            Tool(
-                name="route_message",
-                description="Route a message based on rules",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "message": {"type": "string", "description": "Message to route"},
-                        "rules": {"type": "object", "description": "Routing rules"}
-                    },
-                    "required": ["message", "rules"]
-                }
-            ),
-            Tool(
-                name="get_service_metrics",
-                description="Get performance metrics for a service",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "service_name": {"type": "string", "description": "Service name"}
-                    },
-                    "required": ["service_name"]
-                }
-            )
-        ]
-        return tools
+        return _TOOLS
     
     async def _process_tool_call(self, request: CallToolRequest) -> str:
         """Process a tool call request."""
-        tool_name = request.name
-        arguments = request.arguments
-        
-        if tool_name == "create_proxy_service":
-            return await self._create_proxy_service(arguments)
-        elif tool_name == "list_services":
-            return await self._list_services()
-        elif tool_name == "transform_message":
-            return await self._transform_message(arguments)
-        elif tool_name == "route_message":
-            return await self._route_message(arguments)
-        elif tool_name == "get_service_metrics":
-            return await self._get_service_metrics(arguments)
-        else:
-            raise ValueError(f"Unknown tool: {tool_name}")
+        handler = self._dispatch.get(request.name)
+        if handler is None:
+            raise ValueError(f"Unknown tool: {request.name}")
+        return await handler(request.arguments)
     
     async def _create_proxy_service(self, arguments: Dict[str, Any]) -> str:
         """Create a new proxy service."""
@@ -230,7 +289,7 @@ class SynapseMCPServer:
             }
         )
         
-        self.services[name] = service
+        self._add_service(service)
         
         # Record metrics
         self.metrics.record_service_creation(name)
@@ -242,11 +301,10 @@ class SynapseMCPServer:
         if not self.services:
             return "No services configured"
         
-        service_list = []
-        for name, service in self.services.items():
-            service_list.append(f"- {name} ({service.type}): {service.status}")
-        
-        return "Available services:\n" + "\n".join(service_list)
+        return "Available services:\n" + "\n".join(
+            f"- {name} ({service.type}): {service.status}"
+            for name, service in self.services.items()
+        )
     
     async def _transform_message(self, arguments: Dict[str, Any]) -> str:
         """Transform a message using specified transformer."""
@@ -257,11 +315,11 @@ class SynapseMCPServer:
         if not transformer_name or not message:
             return "Error: transformer and message are required"
         
-        if transformer_name not in self.transformers:
+        transformer = self.transformers.get(transformer_name)
+        if transformer is None:
             return f"Error: transformer '{transformer_name}' not found"
         
         try:
-            transformer = self.transformers[transformer_name]
             result = await transformer.transform(message, format_type)
             return f"Transformed message:\n{result}"
         except Exception as e:
@@ -298,34 +356,92 @@ class SynapseMCPServer:
         except Exception as e:
             return f"Error getting metrics: {str(e)}"
     
+    async def _batch_execute(self, arguments: Dict[str, Any]) -> str:
+        """Execute several tool calls concurrently and return their results as JSON."""
+        operations = arguments.get("operations")
+        max_concurrent = arguments.get("maxConcurrent", 10)
+        stop_on_error = arguments.get("stopOnError", False)
+        
+        if not isinstance(operations, list) or not operations:
+            return "Error: operations must be a non-empty list"
+        
+        if len(operations) > BATCH_MAX_OPERATIONS:
+            return f"Error: at most {BATCH_MAX_OPERATIONS} operations are allowed per batch"
+        
+        if not all(isinstance(operation, dict) for operation in operations):
+            return "Error: each operation must be an object with a tool name"
+        
+        if isinstance(max_concurrent, bool) or not isinstance(max_concurrent, int) or max_concurrent < 1:
+            return "Error: maxConcurrent must be a positive integer"
+        
+        if not isinstance(stop_on_error, bool):
+            return "Error: stopOnError must be a boolean"
+        
+        semaphore = asyncio.Semaphore(max_concurrent)
+        
+        async def run(operation: Dict[str, Any]) -> str:
+            tool_name = operation.get("tool")
+            if tool_name == "batch_execute":
+                raise ValueError("batch_execute cannot be nested")
+            handler = self._dispatch.get(tool_name)
+            if handler is None:
+                raise ValueError(f"Unknown tool: {tool_name}")
+            async with semaphore:
+                result = await handler(operation.get("arguments") or {})
+            # Tool handlers report failures as "Error..." text rather than raising
+            if result.startswith("Error"):
+                raise ValueError(result)
+            return result
+        
+        tasks = [asyncio.ensure_future(run(operation)) for operation in operations]
+        
+        if stop_on_error:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+        
+        # Wait for every task to settle, including the ones just cancelled
+        await asyncio.gather(*tasks, return_exceptions=True)
+        
+        results = []
+        for operation, task in zip(operations, tasks):
+            entry = {"tool": operation.get("tool")}
+            if task.cancelled():
+                entry.update(success=False, error="Cancelled after an earlier failure")
+            elif task.exception() is not None:
+                entry.update(success=False, error=str(task.exception()))
+            else:
+                entry.update(success=True, result=task.result())
+            results.append(entry)
+        
+        return json.dumps({"results": results}, indent=2)
+    
+    def _add_service(self, service: SynapseService):
+        """Register a service and its MCP resource."""
+        self.services[service.name] = service
+        self._resources_mirror[service.name] = Resource(
+            uri=f"synapse://services/{service.name}",
+            name=service.name,
+            description=f"Synapse service: {service.type}",
+            mimeType="application/json"
+        )
+    
     async def _get_available_resources(self) -> List[Resource]:
         """Get list of available MCP resources."""
-        resources = []
-        
-        # Add service configurations as resources
-        for name, service in self.services.items():
-            resources.append(
-                Resource(
-                    uri=f"synapse://services/{name}",
-                    name=name,
-                    description=f"Synapse service: {service.type}",
-                    mimeType="application/json"
-                )
-            )
-        
-        return resources
+        return list(self._resources_mirror.values())
     
     async def _read_resource(self, uri: str) -> str:
         """Read a resource by URI."""
-        if uri.startswith("synapse://services/"):
-            service_name = uri.split("/")[-1]
-            if service_name in self.services:
-                service = self.services[service_name]
-                return f"Service: {service.name}\nType: {service.type}\nConfig: {service.config}"
-            else:
-                return f"Service '{service_name}' not found"
-        else:
+        match = _URI_RE.match(uri)
+        if match is None:
             return f"Unknown resource URI: {uri}"
+        
+        service_name = match.group("name")
+        service = self.services.get(service_name)
+        if service is None:
+            return f"Service '{service_name}' not found"
+        return f"Service: {service.name}\nType: {service.type}\nConfig: {service.config}"
     
     def _initialize_default_services(self):
         """Initialize default services and transformers."""
@@ -337,13 +453,58 @@ class SynapseMCPServer:
     async def start(self):
         """Start the MCP server."""
         logger.info("Starting Synapse MCP Server...")
-        await self.mcp_server.run()
+        self._loop = asyncio.get_running_loop()
+        try:
+            await self.mcp_server.run()
+        finally:
+            self._loop = None
     
     async def stop(self):
         """Stop the MCP server."""
         logger.info("Stopping Synapse MCP Server...")
         # Cleanup resources
         self.metrics.close()
+    
+    def call_sync(self, coro: Coroutine[Any, Any, Any], timeout: Optional[float] = None) -> Any:
+        """
+        Run a coroutine on the loop serving MCP requests from another thread.
+        
+        Lets admin scripts and sidecars running in their own threads call into
+        the server. The coroutine runs on the same loop as MCP tool calls, so
+        it shares their state and loop-bound resources without extra locking.
+        
+        Args:
+            coro: Coroutine to run, e.g. server._list_services()
+            timeout: Seconds to wait for the result, or None to wait indefinitely
+            
+        Returns:
+            The coroutine's result
+            
+        Raises:
+            RuntimeError: If called from a thread running an event loop, which
+                would block that loop, or if the server is not running
+            concurrent.futures.TimeoutError: If the result is not ready within
+                timeout; the coroutine is cancelled
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            coro.close()
+            raise RuntimeError("call_sync cannot be used from a running event loop; await the coroutine instead")
+        
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            coro.close()
+            raise RuntimeError("Synapse MCP Server is not running")
+        
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
 
 
 async def main():
@@ -8,12 +8,13 @@ including performance metrics, health checks, and observability features.
 import asyncio
 import logging
 import time
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from collections import defaultdict, deque
-import json
+from array import array
 
+import orjson
 from prometheus_client import Counter, Histogram, Gauge, Summary, generate_latest
 
 logger = logging.getLogger(__name__)
@@ -47,6 +48,9 @@ class MetricsCollector:
     for the Apache Synapse MCP server and its services.
     """
     
+    # Number of recent response times kept per service for percentiles
+    DURATION_WINDOW = 1024
+    
     def __init__(self):
         """Initialize the metrics collector."""
         # Service-specific metrics
@@ -64,6 +68,12 @@ class MetricsCollector:
         # Prometheus metrics
         self._init_prometheus_metrics()
         
+        # Labelled Prometheus children, resolved once per label combination
+        self._request_children: Dict[Tuple[str, str, str], Tuple[Any, Any]] = {}
+        
+        # Fixed-size ring buffers of recent response times, per service
+        self._durations: Dict[str, array] = {}
+        
         # Historical data (last 24 hours)
         self.historical_data: Dict[str, deque] = defaultdict(lambda: deque(maxlen=1440))  # 24 hours * 60 minutes
         
@@ -129,22 +139,42 @@ class MetricsCollector:
         metrics.avg_response_time = metrics.total_response_time / metrics.request_count
         metrics.min_response_time = min(metrics.min_response_time, duration)
         metrics.max_response_time = max(metrics.max_response_time, duration)
-        metrics.last_request_time = datetime.now()
+        now = datetime.now()
+        metrics.last_request_time = now
+        
+        durations = self._durations.get(service_name)
+        if durations is None:
+            durations = array('d', bytes(8 * self.DURATION_WINDOW))
+            self._durations[service_name] = durations
+        durations[(metrics.request_count - 1) % self.DURATION_WINDOW] = duration
         
         # Update global metrics
         self.global_metrics["total_requests"] += 1
-        self.global_metrics["last_request"] = datetime.now()
+        self.global_metrics["last_request"] = now
         
         # Update Prometheus metrics
-        self.request_counter.labels(service=service_name, method=method, status=status).inc()
-        self.request_duration.labels(service=service_name, method=method).observe(duration)
+        counter, histogram = self._get_request_children(service_name, method, status)
+        counter.inc()
+        histogram.observe(duration)
         
         # Record historical data
-        self._record_historical_data(service_name, "requests", 1)
-        self._record_historical_data(service_name, "response_time", duration)
+        self._record_historical_data(service_name, "requests", 1, now)
+        self._record_historical_data(service_name, "response_time", duration, now)
         
         logger.debug(f"Recorded request for service '{service_name}': {duration:.3f}s")
     
+    def _get_request_children(self, service_name: str, method: str, status: str) -> Tuple[Any, Any]:
+        """Get the request counter and duration children for a label combination."""
+        key = (service_name, method, status)
+        children = self._request_children.get(key)
+        if children is None:
+            children = (
+                self.request_counter.labels(service_name, method, status),
+                self.request_duration.labels(service_name, method)
+            )
+            self._request_children[key] = children
+        return children
+    
     def record_error(self, service_name: str, error_type: str = "unknown", error_message: str = ""):
         """Record an error metric."""
         # Update service metrics
@@ -153,17 +183,18 @@ class MetricsCollector:
         
         metrics = self.service_metrics[service_name]
         metrics.error_count += 1
-        metrics.last_error_time = datetime.now()
+        now = datetime.now()
+        metrics.last_error_time = now
         
         # Update global metrics
         self.global_metrics["total_errors"] += 1
-        self.global_metrics["last_error"] = datetime.now()
+        self.global_metrics["last_error"] = now
         
         # Update Prometheus metrics
         self.error_counter.labels(service=service_name, error_type=error_type).inc()
         
         # Record historical data
-        self._record_historical_data(service_name, "errors", 1)
+        self._record_historical_data(service_name, "errors", 1, now)
         
         logger.warning(f"Recorded error for service '{service_name}': {error_type} - {error_message}")
     
@@ -182,6 +213,7 @@ class MetricsCollector:
         """Record service deletion."""
         if service_name in self.service_metrics:
             del self.service_metrics[service_name]
+        self._durations.pop(service_name, None)
         
         # Update Prometheus metrics
         self.active_services.dec()
@@ -198,11 +230,11 @@ class MetricsCollector:
         
         logger.debug(f"Recorded health check for service '{service_name}': {status}")
     
-    def _record_historical_data(self, service_name: str, metric_type: str, value: float):
+    def _record_historical_data(self, service_name: str, metric_type: str, value: float,
+                                timestamp: Optional[datetime] = None):
         """Record historical data point."""
-        timestamp = datetime.now()
         data_point = MetricPoint(
-            timestamp=timestamp,
+            timestamp=timestamp or datetime.now(),
             value=value,
             labels={"service": service_name, "type": metric_type}
         )
@@ -227,6 +259,14 @@ class MetricsCollector:
         if metrics.last_request_time:
             uptime = (datetime.now() - metrics.last_request_time).total_seconds()
         
+        # Calculate percentiles over the recent response time window
+        p50 = p99 = 0.0
+        durations = self._durations.get(service_name)
+        if durations is not None:
+            window = sorted(durations[:min(metrics.request_count, self.DURATION_WINDOW)])
+            p50 = self._percentile(window, 50)
+            p99 = self._percentile(window, 99)
+        
         return {
             "service_name": service_name,
             "request_count": metrics.request_count,
@@ -235,11 +275,21 @@ class MetricsCollector:
             "avg_response_time": metrics.avg_response_time,
             "min_response_time": metrics.min_response_time if metrics.min_response_time != float('inf') else 0.0,
             "max_response_time": metrics.max_response_time,
+            "p50_response_time": p50,
+            "p99_response_time": p99,
             "last_request_time": metrics.last_request_time.isoformat() if metrics.last_request_time else None,
             "last_error_time": metrics.last_error_time.isoformat() if metrics.last_error_time else None,
             "uptime_seconds": uptime
         }
     
+    @staticmethod
+    def _percentile(sorted_values: List[float], percent: float) -> float:
+        """Get the nearest-rank percentile of an already sorted list."""
+        if not sorted_values:
+            return 0.0
+        rank = max(int(-(-percent * len(sorted_values) // 100)), 1)
+        return sorted_values[rank - 1]
+    
     def get_global_metrics(self) -> Dict[str, Any]:
         """Get global metrics."""
         uptime = (datetime.now() - self.global_metrics["uptime_start"]).total_seconds()
@@ -316,11 +366,11 @@ class MetricsCollector:
     def export_metrics(self, format: str = "json") -> str:
         """Export metrics in the specified format."""
         if format.lower() == "json":
-            return json.dumps({
+            return orjson.dumps({
                 "global": self.get_global_metrics(),
                 "services": self.get_all_service_metrics(),
                 "health": self.get_health_status()
-            }, indent=2)
+            }, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
         elif format.lower() == "prometheus":
             return self.get_prometheus_metrics()
         else:
@@ -331,9 +381,11 @@ class MetricsCollector:
         if service_name:
             if service_name in self.service_metrics:
                 del self.service_metrics[service_name]
+            self._durations.pop(service_name, None)
             logger.info(f"Reset metrics for service '{service_name}'")
         else:
             self.service_metrics.clear()
+            self._durations.clear()
             self.global_metrics = {
                 "total_requests": 0,
                 "total_errors": 0,
@@ -6,7 +6,9 @@ handling JWT, OAuth2, and API key authentication methods.
 """
 
 import asyncio
+import hashlib
 import logging
+from collections import OrderedDict
 from typing import Dict, Any, Optional, Union
 from dataclasses import dataclass
 import jwt
@@ -47,6 +49,9 @@ class AuthManager:
     authentication methods including JWT, OAuth2, and API keys.
     """
     
+    # Maximum number of distinct credentials whose successful authentication is cached
+    AUTH_CACHE_SIZE = 16384
+    
     def __init__(self, config: SecurityConfig):
         """Initialize the authentication manager."""
         self.config = config
@@ -58,6 +63,10 @@ class AuthManager:
         
         # User cache
         self._user_cache: Dict[str, User] = {}
+        
+        # Credential hash -> expiry (epoch seconds) of a successful authentication,
+        # kept in least recently used order
+        self._auth_cache: "OrderedDict[bytes, float]" = OrderedDict()
     
     async def start(self):
         """Start the authentication manager."""
@@ -95,21 +104,68 @@ class AuthManager:
                 logger.warning("No authentication information found in request")
                 return False
             
+            # Reuse a recent successful authentication of the same credentials
+            cache_key = None
+            if self.config.auth_cache_ttl > 0:
+                cache_key = self._auth_cache_key(auth_info)
+                if self._get_cached_auth(cache_key):
+                    return True
+            
             # Authenticate based on configured method
             if self.config.auth_type == "jwt":
-                return await self._authenticate_jwt(auth_info)
+                authenticated = await self._authenticate_jwt(auth_info)
             elif self.config.auth_type == "oauth2":
-                return await self._authenticate_oauth2(auth_info)
+                authenticated = await self._authenticate_oauth2(auth_info)
             elif self.config.auth_type == "api_key":
-                return await self._authenticate_api_key(auth_info)
+                authenticated = await self._authenticate_api_key(auth_info)
             else:
                 logger.error(f"Unsupported authentication type: {self.config.auth_type}")
                 return False
+            
+            # Only successes are cached, so transient failures are retried
+            if authenticated and cache_key is not None:
+                self._cache_auth_success(cache_key, auth_info)
+            
+            return authenticated
                 
         except Exception as e:
             logger.error(f"Authentication error: {e}")
             return False
     
+    def _auth_cache_key(self, auth_info: Dict[str, Any]) -> bytes:
+        """Hash extracted credentials into an authentication cache key."""
+        return hashlib.blake2b(
+            repr(sorted(auth_info.items())).encode("utf-8"), digest_size=16
+        ).digest()
+    
+    def _get_cached_auth(self, cache_key: bytes) -> bool:
+        """Check for an unexpired cached authentication, evicting it if expired."""
+        expires_at = self._auth_cache.get(cache_key)
+        if expires_at is None:
+            return False
+        
+        if expires_at <= time.time():
+            del self._auth_cache[cache_key]
+            return False
+        
+        self._auth_cache.move_to_end(cache_key)
+        return True
+    
+    def _cache_auth_success(self, cache_key: bytes, auth_info: Dict[str, Any]):
+        """Cache a successful authentication until the TTL or the token's expiry."""
+        expires_at = time.time() + self.config.auth_cache_ttl
+        
+        if self.config.auth_type == "jwt":
+            # The signature was verified by _authenticate_jwt; only the claims are needed here
+            claims = jwt.decode(auth_info["credentials"], options={"verify_signature": False})
+            exp = claims.get("exp")
+            if exp:
+                expires_at = min(expires_at, exp)
+        
+        self._auth_cache[cache_key] = expires_at
+        if len(self._auth_cache) > self.AUTH_CACHE_SIZE:
+            self._auth_cache.popitem(last=False)
+    
     def _extract_auth_info(self, request: Any) -> Optional[Dict[str, Any]]:
         """Extract authentication information from request."""
         # This is a simplified implementation
@@ -362,12 +418,16 @@ class AuthManager:
             if hasattr(user, key):
                 setattr(user, key, value)
         
+        # Cached authentications may belong to this user, e.g. after deactivation
+        self._auth_cache.clear()
+        
         return user
     
     def delete_user(self, user_id: str) -> bool:
         """Delete a user."""
         if user_id in self._user_cache:
             del self._user_cache[user_id]
+            self._auth_cache.clear()
             return True
         return False
     
@@ -375,4 +435,5 @@ class AuthManager:
         """Clear all caches."""
         self._token_cache.clear()
         self._user_cache.clear()
+        self._auth_cache.clear()
         logger.info("Authentication caches cleared") 
\ No newline at end of file
@@ -6,18 +6,15 @@ including order processing, inventory management, and customer operations.
 """
 
 import asyncio
-import json
 import logging
-from datetime import datetime, timedelta
+from collections import defaultdict
+from datetime import datetime
 from typing import Any, Dict, List, Optional
 from dataclasses import dataclass, field
 from enum import Enum
 
 import aiohttp
-from pydantic import BaseModel
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -61,6 +58,8 @@ class Product:
 
 @dataclass
 class OrderItem:
+    __slots__ = ("product_id", "quantity", "unit_price", "total_price")
+    
     product_id: str
     quantity: int
     unit_price: float
@@ -81,6 +80,121 @@ class Order:
     payment_id: Optional[str] = None
 
 
+# Tool definitions are static, so the list is built once at import time
+_TOOLS: List[Dict[str, Any]] = [
+    {
+        "name": "create_order",
+        "description": "Create a new order for a customer",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "customer_id": {"type": "string", "description": "Customer ID"},
+                "items": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "product_id": {"type": "string"},
+                            "quantity": {"type": "integer", "minimum": 1}
+                        },
+                        "required": ["product_id", "quantity"]
+                    }
+                },
+                "shipping_address": {"type": "object"}
+            },
+            "required": ["customer_id", "items", "shipping_address"]
+        }
+    },
+    {
+        "name": "get_order",
+        "description": "Get order details by order ID",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "order_id": {"type": "string", "description": "Order ID"}
+            },
+            "required": ["order_id"]
+        }
+    },
+    {
+        "name": "update_order_status",
+        "description": "Update order status",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "order_id": {"type": "string"},
+                "status": {"type": "string", "enum": [s.value for s in OrderStatus]}
+            },
+            "required": ["order_id", "status"]
+        }
+    },
+    {
+        "name": "check_inventory",
+        "description": "Check product inventory levels",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "product_id": {"type": "string", "description": "Product ID"}
+            },
+            "required": ["product_id"]
+        }
+    },
+    {
+        "name": "check_inventory_batch",
+        "description": "Check inventory levels for several products in one call",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "product_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Product IDs"
+                }
+            },
+            "required": ["product_ids"]
+        }
+    },
+    {
+        "name": "process_payment",
+        "description": "Process payment for an order using the Payment MCP Server",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "order_id": {"type": "string"},
+                "payment_method": {"type": "string"},
+                "payment_details": {"type": "object"}
+            },
+            "required": ["order_id", "payment_method", "payment_details"]
+        }
+    },
+    {
+        "name": "get_customer_orders",
+        "description": "Get all orders for a customer",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "customer_id": {"type": "string"}
+            },
+            "required": ["customer_id"]
+        }
+    },
+    {
+        "name": "add_customer",
+        "description": "Add a new customer",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "email": {"type": "string"},
+                "phone": {"type": "string"},
+                "address": {"type": "object"}
+            },
+            "required": ["name", "email", "phone", "address"]
+        }
+    }
+]
+
+
 class OrderManagementMCPServer:
     """Order Management MCP Server for handling orders, inventory, and customers."""
     
@@ -89,8 +203,23 @@ class OrderManagementMCPServer:
         self.orders: Dict[str, Order] = {}
         self.customers: Dict[str, Customer] = {}
         self.products: Dict[str, Product] = {}
+        
+        # Order IDs per customer, in creation order
+        self._orders_by_customer: Dict[str, List[str]] = defaultdict(list)
         self.payment_server_url = self.config.get("payment_server_url", "http://localhost:8081")
         
+        # Tool name to handler dispatch table
+        self._handlers = {
+            "create_order": self._create_order,
+            "get_order": self._get_order,
+            "update_order_status": self._update_order_status,
+            "check_inventory": self._check_inventory,
+            "check_inventory_batch": self._check_inventory_batch,
+            "process_payment": self._process_payment,
+            "get_customer_orders": self._get_customer_orders,
+            "add_customer": self._add_customer
+        }
+        
         # Initialize with sample data
         self._initialize_sample_data()
         
@@ -159,129 +288,22 @@ class OrderManagementMCPServer:
             )
         }
         
-        logger.info(f"Initialized with {len(self.customers)} customers and {len(self.products)} products")
+        logger.info("Initialized with %s customers and %s products", len(self.customers), len(self.products))
     
     async def get_available_tools(self) -> List[Dict[str, Any]]:
         """Get list of available MCP tools."""
-        return [
-            {
-                "name": "create_order",
-                "description": "Create a new order for a customer",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "customer_id": {"type": "string", "description": "Customer ID"},
-                        "items": {
-                            "type": "array",
-                            "items": {
-                                "type": "object",
-                                "properties": {
-                                    "product_id": {"type": "string"},
-                                    "quantity": {"type": "integer", "minimum": 1}
-                                },
-                                "required": ["product_id", "quantity"]
-                            }
-                        },
-                        "shipping_address": {"type": "object"}
-                    },
-                    "required": ["customer_id", "items", "shipping_address"]
-                }
-            },
-            {
-                "name": "get_order",
-                "description": "Get order details by order ID",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "order_id": {"type": "string", "description": "Order ID"}
-                    },
-                    "required": ["order_id"]
-                }
-            },
-            {
-                "name": "update_order_status",
-                "description": "Update order status",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "order_id": {"type": "string"},
-                        "status": {"type": "string", "enum": [s.value for s in OrderStatus]}
-                    },
-                    "required": ["order_id", "status"]
-                }
-            },
-            {
-                "name": "check_inventory",
-                "description": "Check product inventory levels",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "product_id": {"type": "string", "description": "Product ID"}
-                    },
-                    "required": ["product_id"]
-                }
-            },
-            {
-                "name": "process_payment",
-                "description": "Process payment for an order using the Payment MCP Server",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "order_id": {"type": "string"},
-                        "payment_method": {"type": "string"},
-                        "payment_details": {"type": "object"}
-                    },
-                    "required": ["order_id", "payment_method", "payment_details"]
-                }
-            },
-            {
-                "name": "get_customer_orders",
-                "description": "Get all orders for a customer",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "customer_id": {"type": "string"}
-                    },
-                    "required": ["customer_id"]
-                }
-            },
-            {
-                "name": "add_customer",
-                "description": "Add a new customer",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "name": {"type": "string"},
-                        "email": {"type": "string"},
-                        "phone": {"type": "string"},
-                        "address": {"type": "object"}
-                    },
-                    "required": ["name", "email", "phone", "address"]
-                }
-            }
-        ]
+        return _TOOLS
     
     async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Call a specific tool by name with arguments."""
+        handler = self._handlers.get(name)
+        if handler is None:
+            return {"error": f"Unknown tool: {name}"}
+        
         try:
-            if name == "create_order":
-                return await self._create_order(arguments)
-            elif name == "get_order":
-                return await self._get_order(arguments)
-            elif name == "update_order_status":
-                return await self._update_order_status(arguments)
-            elif name == "check_inventory":
-                return await self._check_inventory(arguments)
-            elif name == "process_payment":
-                return await self._process_payment(arguments)
-            elif name == "get_customer_orders":
-                return await self._get_customer_orders(arguments)
-            elif name == "add_customer":
-                return await self._add_customer(arguments)
-            else:
-                return {"error": f"Unknown tool: {name}"}
+            return await handler(arguments)
         except Exception as e:
-            logger.error(f"Error calling tool {name}: {str(e)}")
+            logger.error("Error calling tool %s: %s", name, e)
             return {"error": str(e)}
     
     async def _create_order(self, args: Dict[str, Any]) -> Dict[str, Any]:
@@ -295,16 +317,17 @@ class OrderManagementMCPServer:
         
         # Validate items and calculate totals
         order_items = []
+        ordered_products = []
         total_amount = 0.0
         
         for item_data in items_data:
             product_id = item_data["product_id"]
             quantity = item_data["quantity"]
             
-            if product_id not in self.products:
+            product = self.products.get(product_id)
+            if product is None:
                 return {"error": f"Product {product_id} not found"}
             
-            product = self.products[product_id]
             if product.stock_quantity < quantity:
                 return {"error": f"Insufficient stock for product {product_id}"}
             
@@ -318,8 +341,10 @@ class OrderManagementMCPServer:
                 unit_price=unit_price,
                 total_price=total_price
             ))
+            ordered_products.append((product, quantity))
         
         # Create order
+        now = datetime.now()
         order_id = f"order_{len(self.orders) + 1:06d}"
         order = Order(
             id=order_id,
@@ -329,17 +354,18 @@ class OrderManagementMCPServer:
             status=OrderStatus.PENDING,
             payment_status=PaymentStatus.PENDING,
             shipping_address=shipping_address,
-            created_at=datetime.now(),
-            updated_at=datetime.now()
+            created_at=now,
+            updated_at=now
         )
         
         self.orders[order_id] = order
+        self._orders_by_customer[customer_id].append(order_id)
         
         # Update inventory
-        for item in order_items:
-            self.products[item.product_id].stock_quantity -= item.quantity
+        for product, quantity in ordered_products:
+            product.stock_quantity -= quantity
         
-        logger.info(f"Created order {order_id} for customer {customer_id}")
+        logger.info("Created order %s for customer %s", order_id, customer_id)
         
         return {
             "success": True,
@@ -353,11 +379,10 @@ class OrderManagementMCPServer:
         """Get order details."""
         order_id = args["order_id"]
         
-        if order_id not in self.orders:
+        order = self.orders.get(order_id)
+        if order is None:
             return {"error": f"Order {order_id} not found"}
         
-        order = self.orders[order_id]
-        
         return {
             "success": True,
             "order": {
@@ -387,7 +412,8 @@ class OrderManagementMCPServer:
         order_id = args["order_id"]
         status = args["status"]
         
-        if order_id not in self.orders:
+        order = self.orders.get(order_id)
+        if order is None:
             return {"error": f"Order {order_id} not found"}
         
         try:
@@ -395,11 +421,10 @@ class OrderManagementMCPServer:
         except ValueError:
             return {"error": f"Invalid status: {status}"}
         
-        order = self.orders[order_id]
         order.status = order_status
         order.updated_at = datetime.now()
         
-        logger.info(f"Updated order {order_id} status to {status}")
+        logger.info("Updated order %s status to %s", order_id, status)
         
         return {
             "success": True,
@@ -412,11 +437,10 @@ class OrderManagementMCPServer:
         """Check product inventory."""
         product_id = args["product_id"]
         
-        if product_id not in self.products:
+        product = self.products.get(product_id)
+        if product is None:
             return {"error": f"Product {product_id} not found"}
         
-        product = self.products[product_id]
-        
         return {
             "success": True,
             "product": {
@@ -427,17 +451,44 @@ class OrderManagementMCPServer:
             }
         }
     
+    async def _check_inventory_batch(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Check inventory for several products."""
+        product_ids = args.get("product_ids")
+        if not isinstance(product_ids, list):
+            return {"error": "product_ids must be a list of product IDs"}
+        
+        products = {}
+        not_found = []
+        
+        for product_id in product_ids:
+            product = self.products.get(product_id)
+            if product is None:
+                not_found.append(product_id)
+                continue
+            
+            products[product_id] = {
+                "id": product.id,
+                "name": product.name,
+                "stock_quantity": product.stock_quantity,
+                "sku": product.sku
+            }
+        
+        return {
+            "success": True,
+            "products": products,
+            "not_found": not_found
+        }
+    
     async def _process_payment(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Process payment using the Payment MCP Server."""
         order_id = args["order_id"]
         payment_method = args["payment_method"]
         payment_details = args["payment_details"]
         
-        if order_id not in self.orders:
+        order = self.orders.get(order_id)
+        if order is None:
             return {"error": f"Order {order_id} not found"}
         
-        order = self.orders[order_id]
-        
         # Prepare payment request for Payment MCP Server
         payment_request = {
             "amount": order.total_amount,
@@ -464,7 +515,7 @@ class OrderManagementMCPServer:
                             order.payment_id = payment_result.get("payment_id")
                             order.updated_at = datetime.now()
                             
-                            logger.info(f"Payment processed successfully for order {order_id}")
+                            logger.info("Payment processed successfully for order %s", order_id)
                             
                             return {
                                 "success": True,
@@ -477,7 +528,7 @@ class OrderManagementMCPServer:
                         return {"error": f"Payment server error: {response.status}"}
         
         except Exception as e:
-            logger.error(f"Error processing payment: {str(e)}")
+            logger.error("Error processing payment: %s", e)
             return {"error": f"Payment processing error: {str(e)}"}
     
     async def _get_customer_orders(self, args: Dict[str, Any]) -> Dict[str, Any]:
@@ -487,6 +538,7 @@ class OrderManagementMCPServer:
         if customer_id not in self.customers:
             return {"error": f"Customer {customer_id} not found"}
         
+        orders = [self.orders[order_id] for order_id in self._orders_by_customer.get(customer_id, ())]
         customer_orders = [
             {
                 "id": order.id,
@@ -495,8 +547,7 @@ class OrderManagementMCPServer:
                 "payment_status": order.payment_status.value,
                 "created_at": order.created_at.isoformat()
             }
-            for order in self.orders.values()
-            if order.customer_id == customer_id
+            for order in orders
         ]
         
         return {
@@ -520,7 +571,7 @@ class OrderManagementMCPServer:
         
         self.customers[customer_id] = customer
         
-        logger.info(f"Added new customer {customer_id}: {customer.name}")
+        logger.info("Added new customer %s: %s", customer_id, customer.name)
         
         return {
             "success": True,
@@ -534,7 +585,7 @@ class OrderManagementMCPServer:
             "name": "Order Management MCP Server",
             "version": "1.0.0",
             "description": "Handles order processing, inventory management, and customer operations",
-            "tools_count": len(await self.get_available_tools()),
+            "tools_count": len(_TOOLS),
             "orders_count": len(self.orders),
             "customers_count": len(self.customers),
             "products_count": len(self.products)
@@ -548,11 +599,11 @@ async def main():
     
     # Get server info
     info = await server.get_server_info()
-    logger.info(f"Server Info: {info}")
+    logger.info("Server Info: %s", info)
     
     # Get available tools
     tools = await server.get_available_tools()
-    logger.info(f"Available tools: {[tool['name'] for tool in tools]}")
+    logger.info("Available tools: %s", [tool['name'] for tool in tools])
     
     # Example: Create an order
     order_result = await server.call_tool("create_order", {
@@ -570,8 +621,9 @@ async def main():
         }
     })
     
-    logger.info(f"Order creation result: {order_result}")
+    logger.info("Order creation result: %s", order_result)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     asyncio.run(main()) 
\ No newline at end of file
@@ -6,19 +6,16 @@ including payment validation, processing, refunds, and financial reporting.
 """
 
 import asyncio
-import json
 import logging
-import uuid
-from datetime import datetime, timedelta
+import os
+from collections import defaultdict
+from datetime import datetime
 from typing import Any, Dict, List, Optional
 from dataclasses import dataclass, field
 from enum import Enum
 
 import aiohttp
-from pydantic import BaseModel
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -99,6 +96,139 @@ class Payment:
     refunded_amount: float = 0.0
 
 
+# Tool definitions are static, so the list is built once at import time
+_TOOLS: List[Dict[str, Any]] = [
+    {
+        "name": "process_payment",
+        "description": "Process a payment for an order",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "amount": {"type": "number", "description": "Payment amount"},
+                "currency": {"type": "string", "description": "Currency code (USD, EUR, etc.)"},
+                "payment_method": {"type": "string", "description": "Payment method type"},
+                "payment_details": {"type": "object", "description": "Payment method details"},
+                "order_id": {"type": "string", "description": "Associated order ID"},
+                "customer_id": {"type": "string", "description": "Customer ID"}
+            },
+            "required": ["amount", "currency", "payment_method", "payment_details", "order_id", "customer_id"]
+        }
+    },
+    {
+        "name": "get_payment",
+        "description": "Get payment details by payment ID",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "payment_id": {"type": "string", "description": "Payment ID"}
+            },
+            "required": ["payment_id"]
+        }
+    },
+    {
+        "name": "refund_payment",
+        "description": "Refund a payment (full or partial)",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "payment_id": {"type": "string"},
+                "amount": {"type": "number", "description": "Refund amount (optional for full refund)"},
+                "reason": {"type": "string", "description": "Refund reason"}
+            },
+            "required": ["payment_id", "reason"]
+        }
+    },
+    {
+        "name": "authorize_payment",
+        "description": "Authorize a payment without capturing funds",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "amount": {"type": "number"},
+                "currency": {"type": "string"},
+                "payment_method": {"type": "string"},
+                "payment_details": {"type": "object"},
+                "order_id": {"type": "string"},
+                "customer_id": {"type": "string"}
+            },
+            "required": ["amount", "currency", "payment_method", "payment_details", "order_id", "customer_id"]
+        }
+    },
+    {
+        "name": "capture_payment",
+        "description": "Capture a previously authorized payment",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "payment_id": {"type": "string"},
+                "amount": {"type": "number", "description": "Amount to capture (optional for full amount)"}
+            },
+            "required": ["payment_id"]
+        }
+    },
+    {
+        "name": "void_payment",
+        "description": "Void a payment before it's captured",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "payment_id": {"type": "string"},
+                "reason": {"type": "string"}
+            },
+            "required": ["payment_id", "reason"]
+        }
+    },
+    {
+        "name": "get_customer_payments",
+        "description": "Get all payments for a customer",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "customer_id": {"type": "string"},
+                "status": {"type": "string", "description": "Filter by status (optional)"}
+            },
+            "required": ["customer_id"]
+        }
+    },
+    {
+        "name": "add_payment_method",
+        "description": "Add a new payment method for a customer",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "customer_id": {"type": "string"},
+                "payment_method": {"type": "object"}
+            },
+            "required": ["customer_id", "payment_method"]
+        }
+    },
+    {
+        "name": "validate_payment_method",
+        "description": "Validate a payment method",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "payment_method": {"type": "string"},
+                "payment_details": {"type": "object"}
+            },
+            "required": ["payment_method", "payment_details"]
+        }
+    },
+    {
+        "name": "get_payment_statistics",
+        "description": "Get payment processing statistics",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "start_date": {"type": "string", "description": "Start date (ISO format)"},
+                "end_date": {"type": "string", "description": "End date (ISO format)"},
+                "currency": {"type": "string", "description": "Filter by currency (optional)"}
+            }
+        }
+    }
+]
+
+
 class PaymentProcessingMCPServer:
     """Payment Processing MCP Server for handling payments, refunds, and financial operations."""
     
@@ -107,6 +237,9 @@ class PaymentProcessingMCPServer:
         self.payments: Dict[str, Payment] = {}
         self.customers: Dict[str, Customer] = {}
         self.transactions: Dict[str, Transaction] = {}
+        
+        # Payment IDs per customer, in creation order
+        self._payments_by_customer: Dict[str, List[str]] = defaultdict(list)
         self.order_server_url = self.config.get("order_server_url", "http://localhost:8080")
         
         # Payment gateway simulation
@@ -117,6 +250,20 @@ class PaymentProcessingMCPServer:
             "supported_methods": ["credit_card", "debit_card", "bank_transfer", "digital_wallet"]
         }
         
+        # Tool name to handler dispatch table
+        self._handlers = {
+            "process_payment": self._process_payment,
+            "get_payment": self._get_payment,
+            "refund_payment": self._refund_payment,
+            "authorize_payment": self._authorize_payment,
+            "capture_payment": self._capture_payment,
+            "void_payment": self._void_payment,
+            "get_customer_payments": self._get_customer_payments,
+            "add_payment_method": self._add_payment_method,
+            "validate_payment_method": self._validate_payment_method,
+            "get_payment_statistics": self._get_payment_statistics
+        }
+        
         # Initialize with sample data
         self._initialize_sample_data()
         
@@ -171,168 +318,22 @@ class PaymentProcessingMCPServer:
             )
         }
         
-        logger.info(f"Initialized with {len(self.customers)} customers")
+        logger.info("Initialized with %s customers", len(self.customers))
     
     async def get_available_tools(self) -> List[Dict[str, Any]]:
         """Get list of available MCP tools."""
-        return [
-            {
-                "name": "process_payment",
-                "description": "Process a payment for an order",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "amount": {"type": "number", "description": "Payment amount"},
-                        "currency": {"type": "string", "description": "Currency code (USD, EUR, etc.)"},
-                        "payment_method": {"type": "string", "description": "Payment method type"},
-                        "payment_details": {"type": "object", "description": "Payment method details"},
-                        "order_id": {"type": "string", "description": "Associated order ID"},
-                        "customer_id": {"type": "string", "description": "Customer ID"}
-                    },
-                    "required": ["amount", "currency", "payment_method", "payment_details", "order_id", "customer_id"]
-                }
-            },
-            {
-                "name": "get_payment",
-                "description": "Get payment details by payment ID",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "payment_id": {"type": "string", "description": "Payment ID"}
-                    },
-                    "required": ["payment_id"]
-                }
-            },
-            {
-                "name": "refund_payment",
-                "description": "Refund a payment (full or partial)",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "payment_id": {"type": "string"},
-                        "amount": {"type": "number", "description": "Refund amount (optional for full refund)"},
-                        "reason": {"type": "string", "description": "Refund reason"}
-                    },
-                    "required": ["payment_id", "reason"]
-                }
-            },
-            {
-                "name": "authorize_payment",
-                "description": "Authorize a payment without capturing funds",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "amount": {"type": "number"},
-                        "currency": {"type": "string"},
-                        "payment_method": {"type": "string"},
-                        "payment_details": {"type": "object"},
-                        "order_id": {"type": "string"},
-                        "customer_id": {"type": "string"}
-                    },
-                    "required": ["amount", "currency", "payment_method", "payment_details", "order_id", "customer_id"]
-                }
-            },
-            {
-                "name": "capture_payment",
-                "description": "Capture a previously authorized payment",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "payment_id": {"type": "string"},
-                        "amount": {"type": "number", "description": "Amount to capture (optional for full amount)"}
-                    },
-                    "required": ["payment_id"]
-                }
-            },
-            {
-                "name": "void_payment",
-                "description": "Void a payment before it's captured",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "payment_id": {"type": "string"},
-                        "reason": {"type": "string"}
-                    },
-                    "required": ["payment_id", "reason"]
-                }
-            },
-            {
-                "name": "get_customer_payments",
-                "description": "Get all payments for a customer",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "customer_id": {"type": "string"},
-                        "status": {"type": "string", "description": "Filter by status (optional)"}
-                    },
-                    "required": ["customer_id"]
-                }
-            },
-            {
-                "name": "add_payment_method",
-                "description": "Add a new payment method for a customer",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "customer_id": {"type": "string"},
-                        "payment_method": {"type": "object"}
-                    },
-                    "required": ["customer_id", "payment_method"]
-                }
-            },
-            {
-                "name": "validate_payment_method",
-                "description": "Validate a payment method",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "payment_method": {"type": "string"},
-                        "payment_details": {"type": "object"}
-                    },
-                    "required": ["payment_method", "payment_details"]
-                }
-            },
-            {
-                "name": "get_payment_statistics",
-                "description": "Get payment processing statistics",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "start_date": {"type": "string", "description": "Start date (ISO format)"},
-                        "end_date": {"type": "string", "description": "End date (ISO format)"},
-                        "currency": {"type": "string", "description": "Filter by currency (optional)"}
-                    }
-                }
-            }
-        ]
+        return _TOOLS
     
     async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Call a specific tool by name with arguments."""
+        handler = self._handlers.get(name)
+        if handler is None:
+            return {"error": f"Unknown tool: {name}"}
+        
         try:
-            if name == "process_payment":
-                return await self._process_payment(arguments)
-            elif name == "get_payment":
-                return await self._get_payment(arguments)
-            elif name == "refund_payment":
-                return await self._refund_payment(arguments)
-            elif name == "authorize_payment":
-                return await self._authorize_payment(arguments)
-            elif name == "capture_payment":
-                return await self._capture_payment(arguments)
-            elif name == "void_payment":
-                return await self._void_payment(arguments)
-            elif name == "get_customer_payments":
-                return await self._get_customer_payments(arguments)
-            elif name == "add_payment_method":
-                return await self._add_payment_method(arguments)
-            elif name == "validate_payment_method":
-                return await self._validate_payment_method(arguments)
-            elif name == "get_payment_statistics":
-                return await self._get_payment_statistics(arguments)
-            else:
-                return {"error": f"Unknown tool: {name}"}
+            return await handler(arguments)
         except Exception as e:
-            logger.error(f"Error calling tool {name}: {str(e)}")
+            logger.error("Error calling tool %s: %s", name, e)
             return {"error": str(e)}
     
     async def _process_payment(self, args: Dict[str, Any]) -> Dict[str, Any]:
@@ -364,25 +365,26 @@ class PaymentProcessingMCPServer:
         success = random.random() < self.gateway_config["success_rate"]
         
         # Create payment
-        payment_id = f"pay_{uuid.uuid4().hex[:8]}"
+        now = datetime.now()
+        payment_id = f"pay_{os.urandom(4).hex()}"
         
         if success:
             # Create transaction
             transaction = Transaction(
-                id=f"txn_{uuid.uuid4().hex[:8]}",
+                id=f"txn_{os.urandom(4).hex()}",
                 payment_id=payment_id,
                 type=TransactionType.PAYMENT,
                 amount=amount,
                 currency=currency,
                 status=PaymentStatus.COMPLETED,
                 gateway_response={
-                    "transaction_id": f"gateway_{uuid.uuid4().hex[:12]}",
+                    "transaction_id": f"gateway_{os.urandom(6).hex()}",
                     "status": "approved",
-                    "authorization_code": f"AUTH{uuid.uuid4().hex[:6].upper()}",
+                    "authorization_code": f"AUTH{os.urandom(3).hex().upper()}",
                     "response_code": "00"
                 },
-                created_at=datetime.now(),
-                processed_at=datetime.now()
+                created_at=now,
+                processed_at=now
             )
             
             # Create payment
@@ -399,17 +401,18 @@ class PaymentProcessingMCPServer:
                     "gateway": "simulated_gateway",
                     "processing_time": self.gateway_config["processing_time"]
                 },
-                created_at=datetime.now(),
-                updated_at=datetime.now()
+                created_at=now,
+                updated_at=now
             )
             
             self.payments[payment_id] = payment
+            self._payments_by_customer[customer_id].append(payment_id)
             self.transactions[transaction.id] = transaction
             
             # Update order status in Order Management Server
             await self._update_order_payment_status(order_id, "paid", payment_id)
             
-            logger.info(f"Payment {payment_id} processed successfully for order {order_id}")
+            logger.info("Payment %s processed successfully for order %s", payment_id, order_id)
             
             return {
                 "success": True,
@@ -423,20 +426,20 @@ class PaymentProcessingMCPServer:
         else:
             # Failed payment
             transaction = Transaction(
-                id=f"txn_{uuid.uuid4().hex[:8]}",
+                id=f"txn_{os.urandom(4).hex()}",
                 payment_id=payment_id,
                 type=TransactionType.PAYMENT,
                 amount=amount,
                 currency=currency,
                 status=PaymentStatus.FAILED,
                 gateway_response={
-                    "transaction_id": f"gateway_{uuid.uuid4().hex[:12]}",
+                    "transaction_id": f"gateway_{os.urandom(6).hex()}",
                     "status": "declined",
                     "error_code": "05",
                     "error_message": "Insufficient funds"
                 },
-                created_at=datetime.now(),
-                processed_at=datetime.now()
+                created_at=now,
+                processed_at=now
             )
             
             payment = Payment(
@@ -452,14 +455,15 @@ class PaymentProcessingMCPServer:
                     "gateway": "simulated_gateway",
                     "processing_time": self.gateway_config["processing_time"]
                 },
-                created_at=datetime.now(),
-                updated_at=datetime.now()
+                created_at=now,
+                updated_at=now
             )
             
             self.payments[payment_id] = payment
+            self._payments_by_customer[customer_id].append(payment_id)
             self.transactions[transaction.id] = transaction
             
-            logger.warning(f"Payment {payment_id} failed for order {order_id}")
+            logger.warning("Payment %s failed for order %s", payment_id, order_id)
             
             return {
                 "success": False,
@@ -473,11 +477,10 @@ class PaymentProcessingMCPServer:
         """Get payment details."""
         payment_id = args["payment_id"]
         
-        if payment_id not in self.payments:
+        payment = self.payments.get(payment_id)
+        if payment is None:
             return {"error": f"Payment {payment_id} not found"}
         
-        payment = self.payments[payment_id]
-        
         return {
             "success": True,
             "payment": {
@@ -512,11 +515,10 @@ class PaymentProcessingMCPServer:
         reason = args["reason"]
         refund_amount = args.get("amount")  # Optional, defaults to full amount
         
-        if payment_id not in self.payments:
+        payment = self.payments.get(payment_id)
+        if payment is None:
             return {"error": f"Payment {payment_id} not found"}
         
-        payment = self.payments[payment_id]
-        
         if payment.status != PaymentStatus.COMPLETED:
             return {"error": "Payment must be completed to be refunded"}
         
@@ -527,27 +529,28 @@ class PaymentProcessingMCPServer:
             return {"error": "Refund amount exceeds available amount"}
         
         # Create refund transaction
+        now = datetime.now()
         refund_transaction = Transaction(
-            id=f"txn_{uuid.uuid4().hex[:8]}",
+            id=f"txn_{os.urandom(4).hex()}",
             payment_id=payment_id,
             type=TransactionType.REFUND,
             amount=refund_amount,
             currency=payment.currency,
             status=PaymentStatus.COMPLETED,
             gateway_response={
-                "transaction_id": f"gateway_{uuid.uuid4().hex[:12]}",
+                "transaction_id": f"gateway_{os.urandom(6).hex()}",
                 "status": "approved",
-                "refund_id": f"REFUND{uuid.uuid4().hex[:6].upper()}",
+                "refund_id": f"REFUND{os.urandom(3).hex().upper()}",
                 "reason": reason
             },
-            created_at=datetime.now(),
-            processed_at=datetime.now()
+            created_at=now,
+            processed_at=now
         )
         
         # Update payment
         payment.transactions.append(refund_transaction)
         payment.refunded_amount += refund_amount
-        payment.updated_at = datetime.now()
+        payment.updated_at = now
         
         if payment.refunded_amount >= payment.amount:
             payment.status = PaymentStatus.REFUNDED
@@ -556,7 +559,7 @@ class PaymentProcessingMCPServer:
         
         self.transactions[refund_transaction.id] = refund_transaction
         
-        logger.info(f"Refunded {refund_amount} from payment {payment_id}")
+        logger.info("Refunded %s from payment %s", refund_amount, payment_id)
         
         return {
             "success": True,
@@ -592,11 +595,10 @@ class PaymentProcessingMCPServer:
         payment_id = args["payment_id"]
         capture_amount = args.get("amount")
         
-        if payment_id not in self.payments:
+        payment = self.payments.get(payment_id)
+        if payment is None:
             return {"error": f"Payment {payment_id} not found"}
         
-        payment = self.payments[payment_id]
-        
         if payment.status != PaymentStatus.AUTHORIZED:
             return {"error": "Payment must be authorized to be captured"}
         
@@ -604,30 +606,31 @@ class PaymentProcessingMCPServer:
             capture_amount = payment.amount
         
         # Create capture transaction
+        now = datetime.now()
         capture_transaction = Transaction(
-            id=f"txn_{uuid.uuid4().hex[:8]}",
+            id=f"txn_{os.urandom(4).hex()}",
             payment_id=payment_id,
             type=TransactionType.CAPTURE,
             amount=capture_amount,
             currency=payment.currency,
             status=PaymentStatus.COMPLETED,
             gateway_response={
-                "transaction_id": f"gateway_{uuid.uuid4().hex[:12]}",
+                "transaction_id": f"gateway_{os.urandom(6).hex()}",
                 "status": "approved",
-                "capture_id": f"CAPTURE{uuid.uuid4().hex[:6].upper()}"
+                "capture_id": f"CAPTURE{os.urandom(3).hex().upper()}"
             },
-            created_at=datetime.now(),
-            processed_at=datetime.now()
+            created_at=now,
+            processed_at=now
         )
         
         # Update payment
         payment.transactions.append(capture_transaction)
         payment.status = PaymentStatus.COMPLETED
-        payment.updated_at = datetime.now()
+        payment.updated_at = now
         
         self.transactions[capture_transaction.id] = capture_transaction
         
-        logger.info(f"Captured {capture_amount} from payment {payment_id}")
+        logger.info("Captured %s from payment %s", capture_amount, payment_id)
         
         return {
             "success": True,
@@ -643,40 +646,40 @@ class PaymentProcessingMCPServer:
         payment_id = args["payment_id"]
         reason = args["reason"]
         
-        if payment_id not in self.payments:
+        payment = self.payments.get(payment_id)
+        if payment is None:
             return {"error": f"Payment {payment_id} not found"}
         
-        payment = self.payments[payment_id]
-        
         if payment.status != PaymentStatus.AUTHORIZED:
             return {"error": "Payment must be authorized to be voided"}
         
         # Create void transaction
+        now = datetime.now()
         void_transaction = Transaction(
-            id=f"txn_{uuid.uuid4().hex[:8]}",
+            id=f"txn_{os.urandom(4).hex()}",
             payment_id=payment_id,
             type=TransactionType.VOID,
             amount=0.0,
             currency=payment.currency,
             status=PaymentStatus.COMPLETED,
             gateway_response={
-                "transaction_id": f"gateway_{uuid.uuid4().hex[:12]}",
+                "transaction_id": f"gateway_{os.urandom(6).hex()}",
                 "status": "approved",
-                "void_id": f"VOID{uuid.uuid4().hex[:6].upper()}",
+                "void_id": f"VOID{os.urandom(3).hex().upper()}",
                 "reason": reason
             },
-            created_at=datetime.now(),
-            processed_at=datetime.now()
+            created_at=now,
+            processed_at=now
         )
         
         # Update payment
         payment.transactions.append(void_transaction)
         payment.status = PaymentStatus.CANCELLED
-        payment.updated_at = datetime.now()
+        payment.updated_at = now
         
         self.transactions[void_transaction.id] = void_transaction
         
-        logger.info(f"Voided payment {payment_id}")
+        logger.info("Voided payment %s", payment_id)
         
         return {
             "success": True,
@@ -694,20 +697,20 @@ class PaymentProcessingMCPServer:
             return {"error": f"Customer {customer_id} not found"}
         
         customer_payments = []
-        for payment in self.payments.values():
-            if payment.customer_id == customer_id:
-                if status_filter and payment.status.value != status_filter:
-                    continue
-                
-                customer_payments.append({
-                    "id": payment.id,
-                    "order_id": payment.order_id,
-                    "amount": payment.amount,
-                    "currency": payment.currency,
-                    "status": payment.status.value,
-                    "refunded_amount": payment.refunded_amount,
-                    "created_at": payment.created_at.isoformat()
-                })
+        for payment_id in self._payments_by_customer.get(customer_id, ()):
+            payment = self.payments[payment_id]
+            if status_filter and payment.status.value != status_filter:
+                continue
+            
+            customer_payments.append({
+                "id": payment.id,
+                "order_id": payment.order_id,
+                "amount": payment.amount,
+                "currency": payment.currency,
+                "status": payment.status.value,
+                "refunded_amount": payment.refunded_amount,
+                "created_at": payment.created_at.isoformat()
+            })
         
         return {
             "success": True,
@@ -721,14 +724,13 @@ class PaymentProcessingMCPServer:
         customer_id = args["customer_id"]
         payment_method_data = args["payment_method"]
         
-        if customer_id not in self.customers:
+        customer = self.customers.get(customer_id)
+        if customer is None:
             return {"error": f"Customer {customer_id} not found"}
         
-        customer = self.customers[customer_id]
-        
         # Create new payment method
         payment_method = PaymentMethod(
-            id=f"pm_{uuid.uuid4().hex[:8]}",
+            id=f"pm_{os.urandom(4).hex()}",
             type=payment_method_data["type"],
             last_four=payment_method_data["last_four"],
             expiry_month=payment_method_data["expiry_month"],
@@ -744,7 +746,7 @@ class PaymentProcessingMCPServer:
         
         customer.payment_methods.append(payment_method)
         
-        logger.info(f"Added payment method {payment_method.id} for customer {customer_id}")
+        logger.info("Added payment method %s for customer %s", payment_method.id, customer_id)
         
         return {
             "success": True,
@@ -790,22 +792,18 @@ class PaymentProcessingMCPServer:
         currency_filter = args.get("currency")
         
         # Filter payments by date range
-        filtered_payments = []
-        for payment in self.payments.values():
-            if start_date:
-                start_dt = datetime.fromisoformat(start_date.replace('Z', '+00:00'))
-                if payment.created_at < start_dt:
-                    continue
-            
-            if end_date:
-                end_dt = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
-                if payment.created_at > end_dt:
-                    continue
-            
-            if currency_filter and payment.currency != currency_filter:
-                continue
-            
-            filtered_payments.append(payment)
+        start_dt = datetime.fromisoformat(start_date.replace('Z', '+00:00')) if start_date else None
+        end_dt = datetime.fromisoformat(end_date.replace('Z', '+00:00')) if end_date else None
+        
+        if start_dt is None and end_dt is None and not currency_filter:
+            filtered_payments = list(self.payments.values())
+        else:
+            filtered_payments = [
+                payment for payment in self.payments.values()
+                if (start_dt is None or payment.created_at >= start_dt)
+                and (end_dt is None or payment.created_at <= end_dt)
+                and (not currency_filter or payment.currency == currency_filter)
+            ]
         
         # Calculate statistics
         total_payments = len(filtered_payments)
@@ -850,12 +848,12 @@ class PaymentProcessingMCPServer:
                     headers={"Content-Type": "application/json"}
                 ) as response:
                     if response.status == 200:
-                        logger.info(f"Updated order {order_id} payment status to {status}")
+                        logger.info("Updated order %s payment status to %s", order_id, status)
                     else:
-                        logger.warning(f"Failed to update order {order_id} payment status")
+                        logger.warning("Failed to update order %s payment status", order_id)
         
         except Exception as e:
-            logger.error(f"Error updating order payment status: {str(e)}")
+            logger.error("Error updating order payment status: %s", e)
     
     async def get_server_info(self) -> Dict[str, Any]:
         """Get server information."""
@@ -863,7 +861,7 @@ class PaymentProcessingMCPServer:
             "name": "Payment Processing MCP Server",
             "version": "1.0.0",
             "description": "Handles payment processing, validation, and financial operations",
-            "tools_count": len(await self.get_available_tools()),
+            "tools_count": len(_TOOLS),
             "payments_count": len(self.payments),
             "customers_count": len(self.customers),
             "transactions_count": len(self.transactions),
@@ -878,11 +876,11 @@ async def main():
     
     # Get server info
     info = await server.get_server_info()
-    logger.info(f"Server Info: {info}")
+    logger.info("Server Info: %s", info)
     
     # Get available tools
     tools = await server.get_available_tools()
-    logger.info(f"Available tools: {[tool['name'] for tool in tools]}")
+    logger.info("Available tools: %s", [tool['name'] for tool in tools])
     
     # Example: Process a payment
     payment_result = await server.call_tool("process_payment", {
@@ -899,8 +897,9 @@ async def main():
         "customer_id": "cust_001"
     })
     
-    logger.info(f"Payment processing result: {payment_result}")
+    logger.info("Payment processing result: %s", payment_result)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     asyncio.run(main()) 
\ No newline at end of file
@@ -11,6 +11,7 @@ from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
 from urllib.parse import urlparse
 import aiohttp
+from aiolimiter import AsyncLimiter
 import json
 import xml.etree.ElementTree as ET
 
@@ -51,6 +52,13 @@ class ProxyService:
         self.auth_manager = auth_manager
         self.transformers: Dict[str, MessageTransformer] = {}
         self.session: Optional[aiohttp.ClientSession] = None
+        
+        # Requests per second allowed through to the target, bursting up to
+        # rate_limit; a missing or non-positive rate_limit means unlimited
+        self.limiter: Optional[AsyncLimiter] = (
+            AsyncLimiter(config.rate_limit, 1) if config.rate_limit and config.rate_limit > 0 else None
+        )
+        
         self.stats = {
             "requests": 0,
             "errors": 0,
@@ -119,6 +127,8 @@ class ProxyService:
                 body = await self._transform_request(body)
             
             # Make request to target service
+            if self.limiter is not None:
+                await self.limiter.acquire()
             response = await self._make_request(
                 method, path, headers, body, query_params
             )
@@ -137,6 +147,22 @@ class ProxyService:
             self._update_stats(start_time, success=False)
             raise
     
+    async def process_batch(self, requests: List[Dict[str, Any]], return_exceptions: bool = False) -> List[Any]:
+        """
+        Process several requests concurrently through the proxy service.
+        
+        Args:
+            requests: List of request dictionaries, as accepted by process_request
+            return_exceptions: Return failures in place of their responses instead of raising
+        
+        Returns:
+            List of responses in the same order as the requests
+        """
+        return await asyncio.gather(
+            *(self.process_request(request_data) for request_data in requests),
+            return_exceptions=return_exceptions
+        )
+    
     async def _apply_security(self, headers: Dict[str, str]) -> Dict[str, str]:
         """Apply security measures to the request."""
         if self.config.security == "jwt":
@@ -321,16 +347,14 @@ class ProxyServiceManager:
     async def start_all(self):
         """Start all proxy services."""
         self.running = True
-        for service in self.services.values():
-            await service.start()
+        await asyncio.gather(*(service.start() for service in self.services.values()))
         
         logger.info(f"Started {len(self.services)} proxy services")
     
     async def stop_all(self):
         """Stop all proxy services."""
         self.running = False
-        for service in self.services.values():
-            await service.stop()
+        await asyncio.gather(*(service.stop() for service in self.services.values()))
         
         logger.info(f"Stopped {len(self.services)} proxy services")
     
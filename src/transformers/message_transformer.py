@@ -6,12 +6,14 @@ handling XML/JSON transformations, XSLT processing, and custom transformations.
 """
 
 import asyncio
+import hashlib
 import logging
-from typing import Dict, Any, Optional, Union
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple, Union
 from dataclasses import dataclass
 import json
-import xml.etree.ElementTree as ET
 from lxml import etree
+import orjson
 import xmltodict
 from jinja2 import Template
 
@@ -46,6 +48,17 @@ class MessageTransformer:
             "avg_transform_time": 0.0
         }
         
+        # Parser is reused across calls so libxml2 state is allocated once.
+        # Messages arrive as str and are re-encoded as UTF-8, so the parser
+        # ignores any encoding named in the XML declaration.
+        self._xml_parser = etree.XMLParser(
+            encoding="utf-8",
+            resolve_entities="internal",
+            huge_tree=False,
+            remove_comments=True,
+            remove_pis=True
+        )
+        
         # Initialize transformer based on type
         self._initialize_transformer()
     
@@ -96,15 +109,13 @@ class MessageTransformer:
         """Transform XML to JSON."""
         try:
             # Parse XML
-            root = ET.fromstring(message)
+            root = etree.fromstring(message.strip().encode("utf-8"), parser=self._xml_parser)
             
             # Convert to dictionary
             xml_dict = self._xml_to_dict(root)
             
             # Convert to JSON
-            json_str = json.dumps(xml_dict, indent=2, ensure_ascii=False)
-            
-            return json_str
+            return orjson.dumps(xml_dict, option=orjson.OPT_INDENT_2).decode("utf-8")
             
         except Exception as e:
             raise ValueError(f"Failed to transform XML to JSON: {e}")
@@ -112,7 +123,8 @@ class MessageTransformer:
     def _json_to_xml(self, message: str, direction: str) -> str:
         """Transform JSON to XML."""
         try:
-            # Parse JSON
+            # Parse JSON with the stdlib: orjson turns integers outside the
+            # 64-bit range into floats and rejects NaN/Infinity
             json_data = json.loads(message)
             
             # Convert to XML
@@ -185,7 +197,7 @@ class MessageTransformer:
         # Can be overridden by subclasses or configured
         return message
     
-    def _xml_to_dict(self, element: ET.Element) -> Dict[str, Any]:
+    def _xml_to_dict(self, element: etree._Element) -> Dict[str, Any]:
         """Convert XML element to dictionary."""
         result = {}
         
@@ -220,18 +232,18 @@ class MessageTransformer:
         """Convert dictionary to XML string."""
         if isinstance(data, list):
             # Handle list data
-            root = ET.Element(root_name)
+            root = etree.Element(root_name)
             for item in data:
                 child = self._dict_to_xml_element(item, "item")
                 root.append(child)
         else:
             root = self._dict_to_xml_element(data, root_name)
         
-        return ET.tostring(root, encoding="unicode", method="xml")
+        return etree.tostring(root, encoding="unicode", method="xml")
     
-    def _dict_to_xml_element(self, data: Any, tag_name: str) -> ET.Element:
+    def _dict_to_xml_element(self, data: Any, tag_name: str) -> etree._Element:
         """Convert dictionary to XML element."""
-        element = ET.Element(tag_name)
+        element = etree.Element(tag_name)
         
         if isinstance(data, dict):
             # Handle attributes
@@ -307,9 +319,30 @@ class TransformerRegistry:
     Provides centralized transformer management and discovery.
     """
     
-    def __init__(self):
-        """Initialize the transformer registry."""
-        self.transformers: Dict[str, MessageTransformer] = {}
+    # Bounds for the transform_with_chain result cache
+    CACHE_MAX_ENTRIES = 256
+    CACHE_MAX_MESSAGE_SIZE = 16 * 1024
+    
+    # Transformer types whose output depends only on the input message
+    CACHEABLE_TYPES = frozenset({"xml-to-json", "json-to-xml"})
+    
+    def __init__(self, transformers: Optional[Dict[str, MessageTransformer]] = None):
+        """
+        Initialize the transformer registry.
+        
+        Args:
+            transformers: Optional pre-built mapping of name to transformer
+        """
+        if transformers:
+            for transformer in transformers.values():
+                transformer.validate_config()
+        
+        self.transformers: Dict[str, MessageTransformer] = dict(transformers) if transformers else {}
+        self._chain_cache: "OrderedDict[Tuple[Tuple[str, ...], str, bytes], str]" = OrderedDict()
+        self.cache_stats = {
+            "hits": 0,
+            "misses": 0
+        }
     
     def register(self, transformer: MessageTransformer):
         """Register a transformer."""
@@ -320,6 +353,7 @@ class TransformerRegistry:
         transformer.validate_config()
         
         self.transformers[transformer.name] = transformer
+        self._chain_cache.clear()
         logger.info(f"Registered transformer '{transformer.name}' of type '{transformer.config.type}'")
     
     def unregister(self, name: str):
@@ -328,6 +362,7 @@ class TransformerRegistry:
             raise ValueError(f"Transformer '{name}' not found")
         
         del self.transformers[name]
+        self._chain_cache.clear()
         logger.info(f"Unregistered transformer '{name}'")
     
     def get(self, name: str) -> Optional[MessageTransformer]:
@@ -356,6 +391,11 @@ class TransformerRegistry:
         """
         Transform a message through a chain of transformers.
         
+        When every transformer in the chain is one of CACHEABLE_TYPES, results
+        for messages smaller than CACHE_MAX_MESSAGE_SIZE are kept in a bounded
+        LRU cache keyed by a digest of the message, so repeated bodies skip
+        the chain. Cache hits still count towards each transformer's stats.
+        
         Args:
             message: The message to transform
             transformer_names: List of transformer names to apply in order
@@ -364,13 +404,38 @@ class TransformerRegistry:
         Returns:
             The transformed message
         """
-        result = message
-        
+        chain = []
         for name in transformer_names:
             transformer = self.get(name)
             if not transformer:
                 raise ValueError(f"Transformer '{name}' not found")
-            
+            chain.append(transformer)
+        
+        cacheable = (
+            len(message) < self.CACHE_MAX_MESSAGE_SIZE
+            and all(transformer.config.type in self.CACHEABLE_TYPES for transformer in chain)
+        )
+        if cacheable:
+            start_time = asyncio.get_event_loop().time()
+            digest = hashlib.blake2b(message.encode("utf-8"), digest_size=16).digest()
+            key = (tuple(transformer_names), direction, digest)
+            cached = self._chain_cache.get(key)
+            if cached is not None:
+                self._chain_cache.move_to_end(key)
+                self.cache_stats["hits"] += 1
+                for transformer in chain:
+                    transformer._update_stats(start_time, success=True)
+                return cached
+            self.cache_stats["misses"] += 1
+        
+        result = message
+        
+        for transformer in chain:
             result = await transformer.transform(result, direction)
         
-        return result 
\ No newline at end of file
+        if cacheable:
+            self._chain_cache[key] = result
+            if len(self._chain_cache) > self.CACHE_MAX_ENTRIES:
+                self._chain_cache.popitem(last=False)
+        
+        return result
\ No newline at end of file
@@ -9,7 +9,13 @@ of the Apache Synapse MCP server.
 import pytest
 import asyncio
 import json
-from unittest.mock import Mock, patch
+import os
+import threading
+import time
+import concurrent.futures
+import jwt
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
 
 # Add the src directory to the Python path
 import sys
@@ -19,6 +25,19 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 from src.core.config import SynapseMCPConfig, SecurityConfig
 from src.transformers.message_transformer import MessageTransformer, TransformerConfig
 from src.monitoring.metrics import MetricsCollector
+from src.services.proxy_service import ProxyConfig, ProxyService
+from src.security.auth_manager import AuthManager
+from src.core.server import SynapseMCPServer
+from prometheus_client import REGISTRY
+
+
+@pytest.fixture(autouse=True)
+def isolated_prometheus_registry():
+    """Unregister Prometheus collectors created by a test so each MetricsCollector starts clean."""
+    existing = set(REGISTRY._collector_to_names)
+    yield
+    for collector in set(REGISTRY._collector_to_names) - existing:
+        REGISTRY.unregister(collector)
 
 
 class TestConfiguration:
@@ -67,6 +86,53 @@ class TestConfiguration:
         config.database.type = "invalid"
         with pytest.raises(ValueError, match="Invalid database type"):
             config.validate()
+    
+    def test_config_file_round_trip(self, tmp_path):
+        """Test that a saved configuration loads back unchanged."""
+        config = SynapseMCPConfig()
+        config.host = "0.0.0.0"
+        config.port = 9000
+        config.security.auth_cache_ttl = 60
+        config.monitoring.log_level = "DEBUG"
+        config.synapse_home = "/srv/synapse"
+        config.mcp_resources_enabled = False
+        
+        config_path = tmp_path / "synapse-mcp.yaml"
+        config.save_to_file(str(config_path))
+        loaded = SynapseMCPConfig.from_file(str(config_path))
+        
+        assert loaded.to_dict() == config.to_dict()
+    
+    def test_config_file_reparsed_after_rewrite(self, tmp_path):
+        """Test that rewriting a configuration file is picked up on the next load."""
+        config_path = tmp_path / "synapse-mcp.yaml"
+        config_path.write_text("server:\n  port: 9000\n")
+        
+        assert SynapseMCPConfig.from_file(str(config_path)).port == 9000
+        
+        config_path.write_text("server:\n  port: 9100\n")
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        assert SynapseMCPConfig.from_file(str(config_path)).port == 9100
+    
+    def test_config_file_parse_not_shared(self, tmp_path):
+        """Test that values loaded from a cached parse are not shared between loads."""
+        config_path = tmp_path / "synapse-mcp.yaml"
+        config_path.write_text("server:\n  host: [a, b]\n")
+        
+        first = SynapseMCPConfig.from_file(str(config_path))
+        first.host.append("c")
+        second = SynapseMCPConfig.from_file(str(config_path))
+        
+        assert second.host == ["a", "b"]
+    
+    def test_config_file_missing(self, tmp_path):
+        """Test that loading a missing file raises FileNotFoundError naming the path."""
+        config_path = tmp_path / "missing.yaml"
+        
+        with pytest.raises(FileNotFoundError, match="Configuration file not found: .*missing.yaml"):
+            SynapseMCPConfig.from_file(str(config_path))
 
 
 class TestMessageTransformer:
@@ -153,6 +219,48 @@ class TestMessageTransformer:
         with pytest.raises(ValueError, match="Failed to transform JSON to XML"):
             await json_to_xml_transformer.transform(invalid_json)
     
+    @pytest.mark.asyncio
+    async def test_xml_encoding_declaration_ignored(self, xml_to_json_transformer):
+        """Test that an encoding declaration does not re-decode an already decoded message."""
+        xml_input = '<?xml version="1.0" encoding="ISO-8859-1"?><user><name>café</name></user>'
+        
+        result = await xml_to_json_transformer.transform(xml_input)
+        
+        assert json.loads(result)["name"] == "café"
+    
+    @pytest.mark.asyncio
+    async def test_xml_internal_entities_expanded(self, xml_to_json_transformer):
+        """Test that entities declared in the internal DTD are expanded."""
+        xml_input = '<!DOCTYPE user [<!ENTITY co "Example Corp">]><user><company>&co;</company></user>'
+        
+        result = await xml_to_json_transformer.transform(xml_input)
+        
+        assert json.loads(result)["company"] == "Example Corp"
+    
+    @pytest.mark.asyncio
+    async def test_json_non_finite_numbers(self, json_to_xml_transformer):
+        """Test that NaN and Infinity are still accepted in JSON input."""
+        result = await json_to_xml_transformer.transform('{"order": {"total": NaN, "limit": Infinity}}')
+        
+        assert "<total>nan</total>" in result
+        assert "<limit>inf</limit>" in result
+    
+    @pytest.mark.asyncio
+    async def test_json_large_integers(self, json_to_xml_transformer):
+        """Test that integers outside the 64-bit range keep their exact value."""
+        message = json.dumps({"order": {"big": 2**64, "small": -2**63 - 1}})
+        
+        result = await json_to_xml_transformer.transform(message)
+        
+        assert f"<big>{2**64}</big>" in result
+        assert f"<small>{-2**63 - 1}</small>" in result
+    
+    @pytest.mark.asyncio
+    async def test_json_invalid_tag_name(self, json_to_xml_transformer):
+        """Test that keys which are not valid XML names are rejected."""
+        with pytest.raises(ValueError, match="Failed to transform JSON to XML"):
+            await json_to_xml_transformer.transform('{"first name": "Jane"}')
+    
     def test_transformer_stats(self, xml_to_json_transformer):
         """Test transformer statistics collection."""
         stats = xml_to_json_transformer.get_stats()
@@ -199,6 +307,18 @@ class TestMetricsCollector:
         assert metrics["request_count"] == 0
         assert metrics["error_count"] == 1
     
+    def test_response_time_percentiles(self, metrics_collector):
+        """Test response time percentiles."""
+        service_name = "test-service"
+        
+        for i in range(1, 101):
+            metrics_collector.record_request(service_name, "GET", i / 100, "200")
+        
+        metrics = metrics_collector.get_service_metrics(service_name)
+        
+        assert metrics["p50_response_time"] == 0.50
+        assert metrics["p99_response_time"] == 0.99
+    
     def test_record_service_creation(self, metrics_collector):
         """Test recording service creation."""
         service_name = "new-service"
@@ -280,6 +400,425 @@ class TestMetricsCollector:
         assert global_metrics["total_errors"] == 0
 
 
+class TestProxyService:
+    """Test proxy service functionality."""
+    
+    def _make_service(self, rate_limit):
+        config = ProxyConfig(name="test-proxy", target="http://backend.example.com", rate_limit=rate_limit)
+        service = ProxyService(config, Mock())
+        service._make_request = AsyncMock(return_value={"status_code": 200, "body": ""})
+        return service
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("rate_limit", [0, None])
+    async def test_rate_limit_disabled(self, rate_limit):
+        """Test that a zero or missing rate limit does not throttle requests."""
+        service = self._make_service(rate_limit)
+        
+        assert service.limiter is None
+        
+        response = await service.process_request({"path": "/status"})
+        
+        assert response["status_code"] == 200
+        assert service.stats["errors"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_rate_limit_enabled(self):
+        """Test that a positive rate limit creates a limiter and lets requests through."""
+        service = self._make_service(5)
+        
+        assert service.limiter is not None
+        assert service.limiter.max_rate == 5
+        
+        response = await service.process_request({"path": "/status"})
+        
+        assert response["status_code"] == 200
+    
+    @pytest.mark.asyncio
+    async def test_process_batch_preserves_order(self):
+        """Test that batched responses come back in request order."""
+        service = self._make_service(100)
+        
+        async def make_request(method, path, headers, body, query_params):
+            # Earlier paths finish later, so completion order is reversed
+            await asyncio.sleep(0.01 * (3 - int(path[-1])))
+            return {"status_code": 200, "body": "", "path": path}
+        
+        service._make_request = make_request
+        responses = await service.process_batch([{"path": f"/item{i}"} for i in range(3)])
+        
+        assert [response["path"] for response in responses] == ["/item0", "/item1", "/item2"]
+    
+    @pytest.mark.asyncio
+    async def test_process_batch_failure(self):
+        """Test that a failed request raises by default and fills its own slot with return_exceptions."""
+        service = self._make_service(100)
+        
+        async def make_request(method, path, headers, body, query_params):
+            if path == "/bad":
+                raise RuntimeError("backend down")
+            return {"status_code": 200, "body": "", "path": path}
+        
+        service._make_request = make_request
+        requests = [{"path": "/good"}, {"path": "/bad"}, {"path": "/also-good"}]
+        
+        with pytest.raises(RuntimeError, match="backend down"):
+            await service.process_batch(requests)
+        
+        responses = await service.process_batch(requests, return_exceptions=True)
+        
+        assert responses[0]["path"] == "/good"
+        assert isinstance(responses[1], RuntimeError)
+        assert responses[2]["path"] == "/also-good"
+
+
+class TestAuthManager:
+    """Test authentication result caching."""
+    
+    JWT_SECRET = "test-secret-of-at-least-32-bytes!"
+    
+    def _make_manager(self, auth_cache_ttl=300):
+        config = SecurityConfig(auth_type="jwt", jwt_secret=self.JWT_SECRET, auth_cache_ttl=auth_cache_ttl)
+        return AuthManager(config)
+    
+    def _make_token(self, expires_in):
+        return jwt.encode({"sub": "user-1", "exp": int(time.time()) + expires_in}, self.JWT_SECRET, algorithm="HS256")
+    
+    async def _authenticate(self, auth_manager, token, now=None):
+        auth_info = {"type": "bearer", "credentials": token}
+        with patch.object(auth_manager, "_extract_auth_info", return_value=auth_info), \
+                patch("src.security.auth_manager.time.time", return_value=now or time.time()):
+            return await auth_manager.authenticate_request(Mock())
+    
+    @pytest.mark.asyncio
+    async def test_success_is_cached(self):
+        """Test that a successful authentication is reused for the same credentials."""
+        auth_manager = self._make_manager()
+        token = self._make_token(3600)
+        
+        with patch.object(auth_manager, "_authenticate_jwt", wraps=auth_manager._authenticate_jwt) as verify:
+            assert await self._authenticate(auth_manager, token) is True
+            assert await self._authenticate(auth_manager, token) is True
+        
+        assert verify.call_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_cache_capped_at_token_expiry(self):
+        """Test that a cached authentication does not outlive the token's exp claim."""
+        auth_manager = self._make_manager(auth_cache_ttl=300)
+        token = self._make_token(10)
+        now = time.time()
+        
+        with patch.object(auth_manager, "_authenticate_jwt", wraps=auth_manager._authenticate_jwt) as verify:
+            assert await self._authenticate(auth_manager, token, now) is True
+            await self._authenticate(auth_manager, token, now + 5)
+            assert verify.call_count == 1
+            
+            await self._authenticate(auth_manager, token, now + 20)
+            assert verify.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_failure_not_cached(self):
+        """Test that a failed authentication is retried on the next request."""
+        auth_manager = self._make_manager()
+        token = self._make_token(3600)
+        
+        with patch.object(auth_manager, "_authenticate_jwt", AsyncMock(side_effect=[False, True])) as verify:
+            assert await self._authenticate(auth_manager, token) is False
+            assert await self._authenticate(auth_manager, token) is True
+            assert await self._authenticate(auth_manager, token) is True
+        
+        assert verify.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_cache_disabled_with_zero_ttl(self):
+        """Test that auth_cache_ttl=0 verifies every request."""
+        auth_manager = self._make_manager(auth_cache_ttl=0)
+        token = self._make_token(3600)
+        
+        with patch.object(auth_manager, "_authenticate_jwt", wraps=auth_manager._authenticate_jwt) as verify:
+            await self._authenticate(auth_manager, token)
+            await self._authenticate(auth_manager, token)
+        
+        assert verify.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_cache_cleared_on_user_update(self):
+        """Test that deactivating a user drops cached authentications."""
+        auth_manager = self._make_manager()
+        token = self._make_token(3600)
+        
+        assert await self._authenticate(auth_manager, token) is True
+        auth_manager.update_user("user-1", active=False)
+        
+        assert await self._authenticate(auth_manager, token) is False
+
+
+class RecordingSession:
+    """Stand-in for the MCP session that records the handlers registered on it."""
+    
+    def __init__(self, *args, **kwargs):
+        self.handlers = {}
+    
+    def __getattr__(self, name):
+        def decorator_factory():
+            def register(handler):
+                self.handlers[name] = handler
+                return handler
+            return register
+        return decorator_factory
+
+
+class TestSynapseMCPServer:
+    """Test the Synapse MCP server tool handling."""
+    
+    @pytest.fixture
+    def server(self):
+        """Create a server with the MCP session replaced by a handler recorder."""
+        with patch("src.core.server.ServerSession", RecordingSession), \
+                patch("src.core.server.StdioServerParameters"):
+            server = SynapseMCPServer()
+        server.auth_manager.authenticate_request = AsyncMock(return_value=True)
+        return server
+    
+    @pytest.fixture
+    def running_server(self, server):
+        """Run server.start() on an event loop in a background thread."""
+        loop = asyncio.new_event_loop()
+        serving = threading.Event()
+        
+        async def run_session():
+            serving.set()
+            await asyncio.sleep(3600)
+        
+        def serve():
+            try:
+                loop.run_until_complete(start_task)
+            except asyncio.CancelledError:
+                pass
+        
+        server.mcp_server.run = run_session
+        start_task = loop.create_task(server.start())
+        thread = threading.Thread(target=serve, daemon=True)
+        thread.start()
+        serving.wait(5)
+        
+        yield server, loop
+        
+        loop.call_soon_threadsafe(start_task.cancel)
+        thread.join(5)
+        loop.close()
+    
+    def test_call_sync_runs_on_serving_loop(self, running_server):
+        """Test that call_sync runs coroutines on the loop serving MCP requests."""
+        server, loop = running_server
+        
+        async def current_loop():
+            return asyncio.get_running_loop()
+        
+        assert server.call_sync(current_loop(), timeout=5) is loop
+        assert server.call_sync(server._list_services(), timeout=5) == "No services configured"
+    
+    def test_call_sync_timeout_cancels(self, running_server):
+        """Test that a call_sync timeout cancels the coroutine instead of letting it finish."""
+        server, loop = running_server
+        completed = []
+        
+        async def slow():
+            await asyncio.sleep(0.3)
+            completed.append(True)
+        
+        with pytest.raises(concurrent.futures.TimeoutError):
+            server.call_sync(slow(), timeout=0.05)
+        
+        time.sleep(0.5)
+        assert completed == []
+    
+    def test_call_sync_requires_running_server(self, server):
+        """Test that call_sync refuses to run before the server has started."""
+        with pytest.raises(RuntimeError, match="not running"):
+            server.call_sync(server._list_services())
+    
+    @pytest.mark.asyncio
+    async def test_call_sync_refused_in_running_loop(self, server):
+        """Test that call_sync refuses to block a running event loop."""
+        with pytest.raises(RuntimeError, match="running event loop"):
+            server.call_sync(server._list_services())
+    
+    async def _call_tool(self, server, name, arguments=None):
+        request = SimpleNamespace(name=name, arguments=arguments or {})
+        result = await server.mcp_server.handlers["call_tool"](request)
+        return result.content[0].text
+    
+    @pytest.mark.asyncio
+    async def test_safe_tool_result_discarded_on_auth_failure(self, server):
+        """Test that a read-only tool run alongside authentication is discarded if auth fails."""
+        server.auth_manager.authenticate_request = AsyncMock(return_value=False)
+        server._dispatch["list_services"] = AsyncMock(return_value="secret listing")
+        
+        text = await self._call_tool(server, "list_services")
+        
+        assert text == "Authentication failed"
+    
+    @pytest.mark.asyncio
+    async def test_safe_tool_error_hidden_on_auth_failure(self, server):
+        """Test that auth failure takes precedence over a tool error."""
+        server.auth_manager.authenticate_request = AsyncMock(return_value=False)
+        server._dispatch["get_service_metrics"] = AsyncMock(side_effect=RuntimeError("internal detail"))
+        
+        text = await self._call_tool(server, "get_service_metrics", {"service_name": "svc"})
+        
+        assert text == "Authentication failed"
+    
+    @pytest.mark.asyncio
+    async def test_safe_tool_error_precedence(self, server):
+        """Test that an auth exception wins over a tool error, and a tool error surfaces once auth passes."""
+        server._dispatch["list_services"] = AsyncMock(side_effect=RuntimeError("tool broke"))
+        
+        server.auth_manager.authenticate_request = AsyncMock(side_effect=RuntimeError("auth broke"))
+        assert await self._call_tool(server, "list_services") == "Error: auth broke"
+        
+        server.auth_manager.authenticate_request = AsyncMock(return_value=True)
+        assert await self._call_tool(server, "list_services") == "Error: tool broke"
+    
+    @pytest.mark.asyncio
+    async def test_unsafe_tool_not_run_on_auth_failure(self, server):
+        """Test that tools outside _SAFE_TOOLS only run after authentication succeeds."""
+        server.auth_manager.authenticate_request = AsyncMock(return_value=False)
+        handler = AsyncMock(return_value="created")
+        server._dispatch["create_proxy_service"] = handler
+        
+        text = await self._call_tool(server, "create_proxy_service", {"name": "svc", "target": "http://x"})
+        
+        assert text == "Authentication failed"
+        handler.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_resources_follow_created_services(self, server):
+        """Test that listed resources track created services without duplicates."""
+        await server._create_proxy_service({"name": "orders", "target": "http://orders.example.com"})
+        await server._create_proxy_service({"name": "payments", "target": "http://payments.example.com"})
+        await server._create_proxy_service({"name": "orders", "target": "http://orders-v2.example.com"})
+        
+        result = await server.mcp_server.handlers["list_resources"](Mock())
+        
+        assert [str(resource.uri) for resource in result.resources] == [
+            "synapse://services/orders",
+            "synapse://services/payments"
+        ]
+        assert [resource.name for resource in result.resources] == list(server.services)
+    
+    @pytest.mark.asyncio
+    async def test_batch_execute_preserves_order(self, server):
+        """Test that batch results follow operation order, not completion order."""
+        async def slow(arguments):
+            await asyncio.sleep(0.05)
+            return "slow"
+        
+        server._dispatch["slow"] = slow
+        result = json.loads(await server._batch_execute({
+            "operations": [
+                {"tool": "slow"},
+                {"tool": "list_services"},
+                {"tool": "missing"}
+            ]
+        }))
+        
+        assert [entry["tool"] for entry in result["results"]] == ["slow", "list_services", "missing"]
+        assert result["results"][0] == {"tool": "slow", "success": True, "result": "slow"}
+        assert result["results"][1]["result"] == "No services configured"
+        assert result["results"][2] == {"tool": "missing", "success": False, "error": "Unknown tool: missing"}
+    
+    @pytest.mark.asyncio
+    async def test_batch_execute_stop_on_error(self, server):
+        """Test that stopOnError cancels operations still pending after a failure."""
+        completed = []
+        
+        async def fail(arguments):
+            raise RuntimeError("boom")
+        
+        async def slow(arguments):
+            await asyncio.sleep(1)
+            completed.append("slow")
+            return "slow"
+        
+        server._dispatch["fail"] = fail
+        server._dispatch["slow"] = slow
+        result = json.loads(await server._batch_execute({
+            "operations": [{"tool": "fail"}, {"tool": "slow"}],
+            "stopOnError": True
+        }))
+        
+        assert result["results"][0] == {"tool": "fail", "success": False, "error": "boom"}
+        assert result["results"][1]["success"] is False
+        assert "Cancelled" in result["results"][1]["error"]
+        assert completed == []
+    
+    @pytest.mark.asyncio
+    async def test_batch_execute_error_results_are_failures(self, server):
+        """Test that tools reporting errors as text count as failures and trigger stopOnError."""
+        completed = []
+        
+        async def slow(arguments):
+            await asyncio.sleep(1)
+            completed.append("slow")
+            return "slow"
+        
+        server._dispatch["slow"] = slow
+        result = json.loads(await server._batch_execute({
+            "operations": [
+                {"tool": "create_proxy_service", "arguments": {}},
+                {"tool": "slow"}
+            ],
+            "stopOnError": True
+        }))
+        
+        assert result["results"][0] == {
+            "tool": "create_proxy_service",
+            "success": False,
+            "error": "Error: name and target are required"
+        }
+        assert result["results"][1]["success"] is False
+        assert completed == []
+        
+        result = json.loads(await server._batch_execute({
+            "operations": [{"tool": "get_service_metrics", "arguments": {"service_name": "nope"}}]
+        }))
+        
+        assert result["results"][0]["success"] is False
+        assert result["results"][0]["error"] == "Error: service 'nope' not found"
+    
+    @pytest.mark.asyncio
+    async def test_batch_execute_rejects_nesting(self, server):
+        """Test that batch_execute cannot call itself."""
+        result = json.loads(await server._batch_execute({
+            "operations": [{"tool": "batch_execute", "arguments": {"operations": [{"tool": "list_services"}]}}]
+        }))
+        
+        assert result["results"][0] == {
+            "tool": "batch_execute",
+            "success": False,
+            "error": "batch_execute cannot be nested"
+        }
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("arguments, error", [
+        ({}, "operations must be a non-empty list"),
+        ({"operations": {"tool": "list_services"}}, "operations must be a non-empty list"),
+        ({"operations": [{"tool": "list_services"}] * 101}, "at most 100 operations"),
+        ({"operations": ["list_services"]}, "each operation must be an object"),
+        ({"operations": [{"tool": "list_services"}], "maxConcurrent": "4"}, "maxConcurrent must be a positive integer"),
+        ({"operations": [{"tool": "list_services"}], "maxConcurrent": 0}, "maxConcurrent must be a positive integer"),
+        ({"operations": [{"tool": "list_services"}], "stopOnError": "yes"}, "stopOnError must be a boolean"),
+    ])
+    async def test_batch_execute_validates_arguments(self, server, arguments, error):
+        """Test that malformed batch arguments are rejected with a specific error."""
+        result = await server._batch_execute(arguments)
+        
+        assert result.startswith("Error: ")
+        assert error in result
+
+
 class TestIntegration:
     """Integration tests for the complete system."""
     
@@ -327,6 +866,43 @@ class TestIntegration:
         assert "<id>123</id>" in result
         assert "<name>John Doe</name>" in result
 
+    @pytest.mark.asyncio
+    async def test_transformer_chain_cache(self):
+        """Test that repeated chain transformations are served from the cache."""
+        from src.transformers.message_transformer import TransformerRegistry
+        
+        registry = TransformerRegistry()
+        
+        xml_to_json_config = TransformerConfig(
+            name="xml-to-json",
+            type="xml-to-json",
+            config={}
+        )
+        xml_to_json_transformer = MessageTransformer("xml-to-json", xml_to_json_config)
+        registry.register(xml_to_json_transformer)
+        
+        xml_input = "<user><id>123</id></user>"
+        
+        first = await registry.transform_with_chain(xml_input, ["xml-to-json"], "request")
+        second = await registry.transform_with_chain(xml_input, ["xml-to-json"], "request")
+        
+        assert first == second
+        assert registry.cache_stats == {"hits": 1, "misses": 1}
+        assert xml_to_json_transformer.get_stats()["stats"]["transformations"] == 2
+    
+    @pytest.mark.asyncio
+    async def test_transformer_chain_cache_skips_impure_types(self):
+        """Test that chains containing non-deterministic transformer types are not cached."""
+        from src.transformers.message_transformer import TransformerRegistry
+        
+        registry = TransformerRegistry()
+        registry.register(MessageTransformer("passthrough", TransformerConfig(name="passthrough", type="custom")))
+        
+        await registry.transform_with_chain("payload", ["passthrough"], "request")
+        await registry.transform_with_chain("payload", ["passthrough"], "request")
+        
+        assert registry.cache_stats == {"hits": 0, "misses": 0}
+    
 
 if __name__ == "__main__":
     pytest.main([__file__]) 
\ No newline at end of file
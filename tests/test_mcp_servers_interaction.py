@@ -5,6 +5,7 @@ Tests for the interaction between Order Management and Payment Processing MCP se
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
 import json
 from datetime import datetime
@@ -22,14 +23,14 @@ from services.payment_processing_server import PaymentProcessingMCPServer
 class TestMCPServersInteraction:
     """Test class for MCP servers interaction."""
     
-    @pytest.fixture
+    @pytest_asyncio.fixture
     async def order_server(self):
         """Create Order Management MCP Server instance."""
         return OrderManagementMCPServer({
             "payment_server_url": "http://localhost:8081"
         })
     
-    @pytest.fixture
+    @pytest_asyncio.fixture
     async def payment_server(self):
         """Create Payment Processing MCP Server instance."""
         return PaymentProcessingMCPServer({
@@ -251,6 +252,28 @@ class TestMCPServersInteraction:
         # Stock should be reduced by 1
         assert final_stock == initial_stock - 1
     
+    @pytest.mark.asyncio
+    async def test_inventory_batch_check(self, order_server, payment_server):
+        """Test checking inventory for several products in one call."""
+        result = await order_server.call_tool("check_inventory_batch", {
+            "product_ids": ["prod_001", "prod_002", "non_existent_product"]
+        })
+        
+        assert result["success"] is True
+        assert set(result["products"]) == {"prod_001", "prod_002"}
+        assert result["not_found"] == ["non_existent_product"]
+        
+        single = await order_server.call_tool("check_inventory", {
+            "product_id": "prod_001"
+        })
+        assert result["products"]["prod_001"] == single["product"]
+        
+        result = await order_server.call_tool("check_inventory_batch", {
+            "product_ids": "prod_001"
+        })
+        
+        assert "error" in result
+    
     @pytest.mark.asyncio
     async def test_error_handling(self, order_server, payment_server):
         """Test error handling scenarios."""